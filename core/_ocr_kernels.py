@@ -0,0 +1,116 @@
+# core/_ocr_kernels.py
+"""
+OCR 전처리 커널
+──────────────
+• 평균 임계값 이진화 + 3×3 팽창(MaxFilter)을 한 번의 픽셀 순회로 처리
+• ROI 좌표(ROI_DPI) → 렌더링 픽셀 박스 변환(배율·오차·페이지 경계)을 한 번의 순회로 처리
+• numba가 설치되어 있으면 JIT(병렬) 커널, 없으면 NumPy 벡터 연산으로 대체
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba 미설치 시 NumPy 경로 사용
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _mean_nb(gray):
+        h, w = gray.shape
+        total = 0.0
+        for y in prange(h):
+            s = 0.0
+            for x in range(w):
+                s += gray[y, x]
+            total += s
+        return total / (h * w)
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _threshold_dilate_nb(gray, thresh, out):
+        # 3×3 이웃 중 하나라도 임계값보다 밝으면 255 (가장자리는 복제)
+        h, w = gray.shape
+        for y in prange(h):
+            y0 = max(y - 1, 0)
+            y1 = min(y + 1, h - 1)
+            for x in range(w):
+                x0 = max(x - 1, 0)
+                x1 = min(x + 1, w - 1)
+                v = 0
+                for yy in range(y0, y1 + 1):
+                    for xx in range(x0, x1 + 1):
+                        if gray[yy, xx] > thresh:
+                            v = 255
+                out[y, x] = v
+
+    @njit(nogil=True, cache=True)
+    def _scale_boxes_nb(rects, tols, scale, width, height, out):
+        # 배율 적용(반올림) → 오차만큼 확장 → 페이지 경계로 자르기 (ROI별 1회 순회)
+        for i in range(rects.shape[0]):
+            x = np.int32(np.rint(rects[i, 0] * scale))
+            y = np.int32(np.rint(rects[i, 1] * scale))
+            w = np.int32(np.rint(rects[i, 2] * scale))
+            h = np.int32(np.rint(rects[i, 3] * scale))
+            t = np.int32(np.rint(tols[i] * scale))
+            out[i, 0] = max(x - t, 0)
+            out[i, 1] = max(y - t, 0)
+            out[i, 2] = min(x + w + t, width)
+            out[i, 3] = min(y + h + t, height)
+
+
+def _threshold_dilate_np(gray: np.ndarray, thresh: float, out: np.ndarray) -> None:
+    # 분리형 팽창: 가로 3칸 OR → 세로 3칸 OR
+    mask = np.pad(gray > thresh, 1, mode="edge")
+    rows = mask[:, :-2] | mask[:, 1:-1] | mask[:, 2:]
+    cols = rows[:-2] | rows[1:-1] | rows[2:]
+    np.multiply(cols, 255, out=out, casting="unsafe")
+
+
+def _scale_boxes_np(
+    rects: np.ndarray, tols: np.ndarray, scale: float, width: int, height: int, out: np.ndarray
+) -> None:
+    px = np.rint(rects * scale).astype(np.int32)
+    t = np.rint(tols * scale).astype(np.int32)
+    out[:, 0] = np.maximum(px[:, 0] - t, 0)
+    out[:, 1] = np.maximum(px[:, 1] - t, 0)
+    out[:, 2] = np.minimum(px[:, 0] + px[:, 2] + t, width)
+    out[:, 3] = np.minimum(px[:, 1] + px[:, 3] + t, height)
+
+
+def scale_boxes(
+    rects: np.ndarray, tols: np.ndarray, scale: float, width: int, height: int
+) -> np.ndarray:
+    """
+    (N, 4) [x, y, w, h] ROI 좌표와 오차(N,) → 배율을 적용해 페이지(width×height) 경계 안으로
+    자른 (N, 4) int32 [x0, y0, x1, y1] 렌더링 픽셀 박스
+    """
+    out = np.empty((len(rects), 4), dtype=np.int32)
+    if len(rects) == 0:
+        return out
+    if NUMBA_AVAILABLE:
+        _scale_boxes_nb(
+            np.ascontiguousarray(rects, dtype=np.int32),
+            np.ascontiguousarray(tols, dtype=np.int32),
+            float(scale), int(width), int(height), out
+        )
+    else:
+        _scale_boxes_np(rects, tols, scale, width, height, out)
+    return out
+
+
+def binarize_dilate(gray: np.ndarray) -> np.ndarray:
+    """
+    그레이스케일(uint8, 2D) → 평균 임계값 이진화 + 3×3 팽창 결과(uint8, 0/255)
+    """
+    out = np.empty(gray.shape, dtype=np.uint8)
+    if gray.size == 0:
+        return out
+    if NUMBA_AVAILABLE:
+        _threshold_dilate_nb(gray, _mean_nb(gray), out)
+    else:
+        _threshold_dilate_np(gray, float(gray.mean()), out)
+    return out
@@ -1,28 +1,182 @@
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from openpyxl import Workbook
+from string import ascii_uppercase
+
+from .xlsx_stream import XlsxStreamWriter
+
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:  # xlsxwriter 미설치 시 시트 XML 직접 스트리밍(XlsxStreamWriter) 사용
+    XLSXWRITER_AVAILABLE = False
+
+# 열 지정 문자열 (A ~ XFD) 검사용
+_COL_RE = re.compile(r"[A-Z]{1,3}")
+# 엑셀 최대 열 번호 (XFD)
+_MAX_COL = 16384
+# 열 문자 → 자릿값 (A=1 ... Z=26)
+_LETTER = {ch: i for i, ch in enumerate(ascii_uppercase, start=1)}
+
+
+@lru_cache(maxsize=1024)
+def column_index(letters: str) -> int:
+    """
+    열 문자(A, B, ..., XFD)를 1부터 시작하는 열 번호로 변환합니다.
+    잘못된 열 지정이면 ValueError를 발생시킵니다.
+    """
+    if not _COL_RE.fullmatch(letters):
+        raise ValueError(f"잘못된 열 지정: {letters}")
+    n = len(letters)
+    if n == 1:
+        idx = _LETTER[letters]
+    elif n == 2:
+        idx = _LETTER[letters[0]] * 26 + _LETTER[letters[1]]
+    else:
+        idx = (
+            _LETTER[letters[0]] * 676
+            + _LETTER[letters[1]] * 26
+            + _LETTER[letters[2]]
+        )
+    if idx > _MAX_COL:
+        raise ValueError(f"잘못된 열 지정: {letters}")
+    return idx
+
 
 class ExcelWriter:
     """
     엑셀 파일을 생성하고, 지정된 셀에 값을 기록한 후 저장하는 유틸리티 클래스
+
+    • 값은 행 단위 버퍼에만 모아 두고, 행 순서대로 스트리밍 기록합니다.
+      (전체 셀 객체 모델을 만들지 않음)
+      xlsxwriter가 설치되어 있으면 constant_memory 모드(행을 바로 임시 파일로 기록),
+      없으면 시트 XML을 zip에 직접 스트리밍(XlsxStreamWriter)합니다.
+    • flush_until(row)로 더 이상 바뀌지 않는 행을 미리 내보내 버퍼를 비울 수 있습니다.
     """
     def __init__(self, file_path: Path, sheet_name: str = "Sheet1"):
-        # 저장할 파일 경로 및 워크북/워크시트 초기화
+        # 저장할 파일 경로 및 행 버퍼 초기화
         self.file_path = Path(file_path)
-        self.wb = Workbook()
-        self.ws = self.wb.active
-        self.ws.title = sheet_name
+        # 기록 중에는 임시 파일에 쓰고 save()에서 이름을 바꿈
+        # (도중에 실패해도 기존 파일을 덮어쓴 불완전한 엑셀이 남지 않음)
+        self._tmp_path = self.file_path.with_name(self.file_path.name + ".part")
+        self.sheet_name = sheet_name
+        # {row: {col: value}}
+        self._rows: dict[int, dict[int, str]] = {}
+        # 기록된 마지막 행 번호 (save 시 버퍼 재탐색 없이 사용)
+        self._last_row = 0
+        # 스트리밍 워크북 (처음 내보낼 때 생성) 과 다음에 내보낼 행 번호
+        self._wb = None
+        self._ws = None
+        self._next_row = 1
 
     def write_values(self, data: dict[tuple[int, int], str]) -> None:
         """
-        셀 좌표와 값을 매핑하여 워크시트에 기록합니다.
+        셀 좌표와 값을 매핑하여 행 버퍼에 기록합니다.
         data: {(row, col): value, ...}
         """
+        rows = self._rows
+        last_row = self._last_row
         for (row, col), value in data.items():
-            self.ws.cell(row=row, column=col, value=value)
+            if row < self._next_row:
+                raise ValueError(f"이미 기록된 행입니다: {row}")
+            cells = rows.get(row)
+            if cells is None:
+                cells = rows[row] = {}
+                if row > last_row:
+                    last_row = row
+            cells[col] = value
+        self._last_row = last_row
+
+    def write_row(self, row: int, cells: dict[int, str]) -> None:
+        """
+        한 행의 값들을 열 번호 기준으로 한 번에 기록합니다.
+        cells: {col: value, ...}
+        """
+        if not cells:
+            return
+        if row < self._next_row:
+            raise ValueError(f"이미 기록된 행입니다: {row}")
+        buf = self._rows.get(row)
+        if buf is None:
+            self._rows[row] = dict(cells)
+            if row > self._last_row:
+                self._last_row = row
+        else:
+            buf.update(cells)
+
+    def write_table(self, row: int, col: int, table: list[list[str]]) -> None:
+        """
+        2D 리스트를 (row, col) 셀부터 행 단위로 한 번에 기록합니다.
+        None 값은 건너뜁니다.
+        """
+        if table and row < self._next_row:
+            raise ValueError(f"이미 기록된 행입니다: {row}")
+        rows = self._rows
+        for i, values in enumerate(table, start=row):
+            cells = rows.get(i)
+            if cells is None:
+                cells = rows[i] = {}
+            cells.update(
+                (c, v) for c, v in enumerate(values, start=col) if v is not None
+            )
+        if table:
+            self._last_row = max(self._last_row, row + len(table) - 1)
+
+    def flush_until(self, row: int) -> None:
+        """
+        row 이전의 행들을 워크북에 내보내고 버퍼에서 제거합니다.
+        이후에는 row 이전 행에 값을 기록할 수 없습니다.
+        """
+        if self._ws is None:
+            self._open()
+        ws = self._ws
+        rows = self._rows
+        # 행 순서가 증가하므로 두 방식 모두 스트리밍 제약을 만족, 빈 행은 건너뜀
+        for r in range(self._next_row, row):
+            cells = rows.pop(r, None)
+            if not cells:
+                continue
+            if XLSXWRITER_AVAILABLE:
+                for col, value in sorted(cells.items()):
+                    ws.write(r - 1, col - 1, value)
+            else:
+                ws.write_row(r, cells)
+        self._next_row = max(self._next_row, row)
+
+    def _open(self) -> None:
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        if XLSXWRITER_AVAILABLE:
+            self._wb = xlsxwriter.Workbook(
+                str(self._tmp_path),
+                # OCR 텍스트가 URL·수식("=...")처럼 보여도 하이퍼링크·수식으로 바꾸지 않음
+                {
+                    'constant_memory': True, 'use_zip64': True,
+                    'strings_to_urls': False, 'strings_to_formulas': False
+                }
+            )
+            self._ws = self._wb.add_worksheet(self.sheet_name)
+        else:
+            self._wb = self._ws = XlsxStreamWriter(self._tmp_path, self.sheet_name)
 
     def save(self) -> None:
         """
         지정된 경로에 워크북을 저장합니다. 필요한 경우 디렉터리를 생성합니다.
         """
-        self.file_path.parent.mkdir(parents=True, exist_ok=True)
-        self.wb.save(self.file_path)
+        self.flush_until(self._last_row + 1)
+        self._wb.close()
+        self._wb = self._ws = None
+        os.replace(self._tmp_path, self.file_path)
+
+    def abort(self) -> None:
+        """
+        저장하지 않고 기록을 중단합니다. 열린 파일을 닫고 임시 파일을 삭제합니다.
+        """
+        if self._wb is not None:
+            try:
+                self._wb.close()
+            except Exception:
+                pass
+            self._wb = self._ws = None
+        self._rows.clear()
+        self._tmp_path.unlink(missing_ok=True)
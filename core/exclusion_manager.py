@@ -4,16 +4,55 @@ ExclusionManager (단순화 버전)
 ────────────────────────────
 • exclude_strings  : Set[str]
 • JSON 직렬화 only  {"exclude": ["텍스트1", "문구2", ...]}
+• 로드는 백그라운드 스레드에서 수행, API는 로드 완료까지 대기
+• 변경 사항은 잠시 모았다가 백그라운드에서 한 번에 원자적으로 저장
+• matcher(): 제외 문자열 포함 여부를 텍스트 한 번 순회로 검사하는 함수
 """
 
 from __future__ import annotations
-import json, threading
+import atexit, logging, re, threading, time
 from pathlib import Path
-from typing import Set, List
+from typing import Callable, Iterable, Set, List
+
+from .json_io import atomic_write, dumps, loads
+
+logger = logging.getLogger(__name__)
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick 미설치 시 정규식 사용
+    ahocorasick = None
 
 APP_DIR   = Path.home() / "AppData" / "Roaming" / "PdfOcrExcel"
 APP_DIR.mkdir(parents=True, exist_ok=True)
 DATA_PATH = APP_DIR / "exclusions.json"
+# 연속 변경을 모으는 저장 지연 시간(초)
+SAVE_DELAY = 0.5
+# 저장 실패 후 다시 시도하기까지 대기 시간(초)
+SAVE_RETRY_DELAY = 5.0
+# 제외 문자열이 이보다 많으면 Aho-Corasick 오토마톤 사용 (pyahocorasick 설치 시)
+AHOCORASICK_MIN = 100
+
+
+def compile_matcher(strings: Iterable[str]) -> Callable[[str], bool] | None:
+    """
+    제외 문자열 목록 → 텍스트에 하나라도 포함되어 있는지 검사하는 함수
+    (목록이 비어 있으면 None). 문자열마다 따로 찾지 않고 한 번에 검사합니다.
+    """
+    strings = [s for s in strings if s]
+    if not strings:
+        return None
+    if ahocorasick is not None and len(strings) > AHOCORASICK_MIN:
+        automaton = ahocorasick.Automaton()
+        for s in strings:
+            automaton.add_word(s, s)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    # 긴 문자열을 먼저 두어 공통 접두어에서의 되돌림을 줄임
+    pattern = re.compile(
+        "|".join(map(re.escape, sorted(strings, key=len, reverse=True)))
+    )
+    return lambda text: pattern.search(text) is not None
 
 
 class ExclusionManager:
@@ -21,34 +60,74 @@ class ExclusionManager:
 
     def __init__(self) -> None:
         self.exclude_strings: Set[str] = set()
-        self._load()
+        self._dirty = threading.Event()
+        # JSON 로드는 백그라운드에서 수행 (UI 초기화와 병행), API는 완료까지 대기
+        self._ready = threading.Event()
+        threading.Thread(target=self._load_async, daemon=True).start()
+        threading.Thread(target=self._save_loop, daemon=True).start()
+        atexit.register(self.flush)
 
     # ─────────── API ───────────
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """JSON 로드가 끝날 때까지 대기 (끝났으면 True)"""
+        return self._ready.wait(timeout)
+
     def list_all(self) -> List[str]:
+        self._ready.wait()
         return sorted(self.exclude_strings)
 
     def add_many(self, items: List[str]) -> None:
+        self._ready.wait()
         with self._lock:
             self.exclude_strings.update(s.strip() for s in items if s.strip())
-            self._save()
+            self._dirty.set()
 
     def remove(self, item: str) -> None:
+        self._ready.wait()
         with self._lock:
             self.exclude_strings.discard(item)
+            self._dirty.set()
+
+    def matcher(self) -> Callable[[str], bool] | None:
+        """현재 제외 목록으로 만든 포함 여부 검사 함수 (목록이 비어 있으면 None)"""
+        self._ready.wait()
+        with self._lock:
+            return compile_matcher(self.exclude_strings)
+
+    def flush(self) -> None:
+        """대기 중인 변경 사항을 즉시 저장"""
+        with self._lock:
+            if not self._dirty.is_set():
+                return
+            # 저장에 실패하면(디스크 가득 참, 파일 잠김 등) 변경 표시를 남겨 다음에 다시 시도
             self._save()
+            self._dirty.clear()
 
     # ─────────── I/O ───────────
+    def _load_async(self):
+        try:
+            self._load()
+        finally:
+            self._ready.set()
+
     def _load(self):
         if DATA_PATH.exists():
             try:
-                data = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+                data = loads(DATA_PATH.read_bytes())
                 self.exclude_strings = set(data.get("exclude", []))
             except Exception as e:
-                print("[ExclusionManager] Load error:", e)
+                logger.error("Load error: %s", e)
+
+    def _save_loop(self):
+        while True:
+            self._dirty.wait()
+            time.sleep(SAVE_DELAY)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error("Save error: %s", e)
+                time.sleep(SAVE_RETRY_DELAY)
 
     def _save(self):
         data = {"exclude": sorted(self.exclude_strings)}
-        DATA_PATH.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2),
-            encoding="utf-8"
-        )
+        atomic_write(DATA_PATH, dumps(data))
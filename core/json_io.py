@@ -0,0 +1,38 @@
+# core/json_io.py
+"""
+JSON 파일 입출력 도우미
+──────────────────────
+• dumps/loads: orjson이 설치되어 있으면 사용, 없으면 표준 json (들여쓰기 2칸, 한글 보존)
+• atomic_write: 임시 파일에 쓴 뒤 os.replace로 교체 (쓰기 도중 종료돼도 원본 보존)
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    import json
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+    def loads(data: bytes) -> Any:
+        return json.loads(data)
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """data를 path에 원자적으로 기록합니다."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
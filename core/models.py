@@ -4,9 +4,16 @@
 """
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence
 
-@dataclass
+import numpy as np
+
+# ROI 좌표의 기준 DPI (좌표 지정 화면의 픽셀 좌표 = 이 DPI로 렌더링한 페이지 픽셀)
+ROI_DPI = 600
+# ROI별 인식 DPI 허용 범위 (0은 엔진 기본값). 음수는 잘못된 영역, 너무 크면 거대한 렌더링이 됨
+ROI_DPI_RANGE = (72, 1200)
+
+@dataclass(slots=True)
 class ROI:
     name: str
     x: int
@@ -15,6 +22,11 @@ class ROI:
     h: int
     tolerance: int = 0
     field_type: str = 'single'
+    # ROI별 OCR 설정 (빈 문자열이면 엔진 기본값)
+    ocr_lang: str = ''
+    ocr_whitelist: str = ''
+    # 인식 DPI (0이면 엔진 기본값). 작은 글자는 높게, 큰 글자는 낮게 지정
+    dpi: int = 0
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> ROI:
@@ -28,7 +40,10 @@ class ROI:
             w=int(w),
             h=int(h),
             tolerance=int(d.get('tolerance', 0)),
-            field_type=d.get('field_type', 'single')
+            field_type=d.get('field_type', 'single'),
+            ocr_lang=d.get('ocr_lang', ''),
+            ocr_whitelist=d.get('ocr_whitelist', ''),
+            dpi=int(d.get('dpi', 0))
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -39,13 +54,42 @@ class ROI:
             'w': self.w,
             'h': self.h,
             'tolerance': self.tolerance,
-            'field_type': self.field_type
+            'field_type': self.field_type,
+            'ocr_lang': self.ocr_lang,
+            'ocr_whitelist': self.ocr_whitelist,
+            'dpi': self.dpi
         }
 
+def roi_rects(rois: Sequence[ROI]) -> np.ndarray:
+    """ROI 목록 → (N, 4) int32 배열 [x, y, w, h] (SoA 형태의 일괄 좌표 계산용)"""
+    return np.array(
+        [(r.x, r.y, r.w, r.h) for r in rois], dtype=np.int32
+    ).reshape(len(rois), 4)
+
+
+def roi_tolerances(rois: Sequence[ROI]) -> np.ndarray:
+    """ROI 목록 → (N,) int32 오차 배열 (roi_rects 와 같은 순서)"""
+    return np.fromiter((r.tolerance for r in rois), dtype=np.int32, count=len(rois))
+
+
 @dataclass
 class ROISet:
     set_name: str
     rois: List[ROI] = field(default_factory=list)
+    # rects 캐시 (rois 를 직접 수정한 경우 invalidate_rects() 호출)
+    _rects: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def rects(self) -> np.ndarray:
+        """(N, 4) int32 배열 [x, y, w, h]"""
+        if self._rects is None or len(self._rects) != len(self.rois):
+            self._rects = roi_rects(self.rois)
+        return self._rects
+
+    def invalidate_rects(self) -> None:
+        self._rects = None
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> ROISet:
@@ -0,0 +1,121 @@
+# core/ocr_cache.py
+"""
+OCR 결과 디스크 캐시
+──────────────────
+• (PDF 파일 식별자, 페이지, 엔진 설정, ROI 좌표·옵션) → 인식 결과
+• PDF 식별자 = 절대 경로 + 크기 + 수정 시각 (파일 내용 해시 생략)
+• sqlite3 단일 파일에 저장 → 프로그램을 다시 실행해도 재사용
+• 마지막 사용 시각 기록: 열 때 CACHE_MAX_AGE_DAYS 동안 쓰지 않은 결과 삭제,
+  CACHE_MAX_ROWS를 넘으면 오래 쓰지 않은 결과부터 삭제
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable
+
+from .exclusion_manager import APP_DIR
+from .json_io import dumps, loads
+from .models import ROI
+
+CACHE_PATH = APP_DIR / "ocr_cache.sqlite3"
+# 보관할 최대 결과 수 ((페이지, ROI) 단위, 넘으면 오래 쓰지 않은 결과부터 삭제)
+CACHE_MAX_ROWS = 500_000
+# 이 기간 동안 사용하지 않은 결과는 캐시를 열 때 삭제 (다시 저장·이동된 PDF의 옛 결과 등)
+CACHE_MAX_AGE_DAYS = 60
+
+
+def file_id(path: str | Path) -> str:
+    """PDF 파일 식별자 (내용이 바뀌면 크기·수정 시각이 달라짐)"""
+    path = Path(path).resolve()
+    st = path.stat()
+    return f"{path}|{st.st_size}|{st.st_mtime_ns}"
+
+
+def result_key(file: str, page: int, engine: str, roi: ROI) -> str:
+    """인식 결과 키. ROI 이름은 결과에 영향이 없으므로 제외합니다."""
+    d = roi.to_dict()
+    del d['name']
+    raw = f"{file}|{page}|{engine}|{sorted(d.items())}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class OCRCache:
+    _lock = threading.Lock()
+
+    def __init__(self, path: Path = CACHE_PATH) -> None:
+        self.path = Path(path)
+        # 추출 작업 스레드에서도 사용하므로 스레드 검사 해제 (접근은 _lock으로 직렬화)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value BLOB, last_used INTEGER NOT NULL DEFAULT 0)"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(results)")}
+            if "last_used" not in columns:
+                # 사용 시각이 없던 이전 버전 캐시: 지금 사용한 것으로 간주
+                self._conn.execute(
+                    "ALTER TABLE results ADD COLUMN last_used INTEGER NOT NULL DEFAULT 0"
+                )
+                self._conn.execute("UPDATE results SET last_used = ?", (int(time.time()),))
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+            )
+            self._conn.execute(
+                "DELETE FROM results WHERE last_used < ?",
+                (int(time.time()) - CACHE_MAX_AGE_DAYS * 86400,)
+            )
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """저장된 결과만 {키: 값} 으로 반환"""
+        keys = list(keys)
+        found: Dict[str, Any] = {}
+        now = int(time.time())
+        with self._lock, self._conn:
+            # sqlite 변수 개수 제한 이내로 나누어 조회
+            for i in range(0, len(keys), 500):
+                part = keys[i:i + 500]
+                marks = ','.join('?' * len(part))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM results WHERE key IN ({marks})", part
+                )
+                found.update((k, loads(v)) for k, v in rows)
+                # 찾은 결과는 사용 시각 갱신 (LRU 삭제 기준)
+                self._conn.execute(
+                    f"UPDATE results SET last_used = ? WHERE key IN ({marks})", [now, *part]
+                )
+        return found
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        if not items:
+            return
+        now = int(time.time())
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results (key, value, last_used) VALUES (?, ?, ?)",
+                [(k, dumps(v), now) for k, v in items.items()]
+            )
+            self._prune()
+
+    def _prune(self) -> None:
+        # 행 수가 CACHE_MAX_ROWS를 넘으면 오래 쓰지 않은 결과부터 90%까지 삭제
+        # (경계에서 저장할 때마다 삭제하지 않도록 여유를 둠)
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()
+        if count > CACHE_MAX_ROWS:
+            self._conn.execute(
+                "DELETE FROM results WHERE key IN "
+                "(SELECT key FROM results ORDER BY last_used LIMIT ?)",
+                (count - CACHE_MAX_ROWS * 9 // 10,)
+            )
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+        with self._lock:
+            self._conn.execute("VACUUM")
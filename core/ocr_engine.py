@@ -2,128 +2,875 @@
 """
 OCR 엔진 래퍼
 ────────────
-• PyMuPDF로 PDF 페이지를 이미지로 변환
+• PyMuPDF로 PDF 페이지를 이미지로 변환 (경로 또는 열린 fitz.Document)
+• 렌더링된 페이지는 (PDF, 페이지) 단위로 캐시하여 여러 ROI가 공유
 • 영역(Crop) → 전처리 → Tesseract 인식
 • 단일 필드(extract_roi) 및 테이블(extract_table) 지원
+• 한 페이지의 단일 필드 일괄 인식(extract_rois): 설정 묶음당 Tesseract 1회 호출
+• 기본 LSTM 엔진(--oem 1), ROI별 언어·허용 문자 지정 지원
+• 페이지는 8비트 그레이스케일 300 DPI로 렌더링하고, 글자가 작은 ROI만 ROI_DPI(600)로 다시 렌더링
+• 여러 페이지를 워커 프로세스로 나누어 병렬 인식(extract_pages_parallel)
+• 전처리한 영역의 픽셀 해시 → 인식 결과 LRU: 같은 양식의 반복 영역은 다시 인식하지 않음
+• tesserocr가 설치되어 있으면 엔진(프로세스)마다 Tesseract API를 한 번만 열어 재사용,
+  없으면 pytesseract(호출마다 tesseract 실행)로 대체
 """
 
 from __future__ import annotations
-import io
+import os
+import hashlib
+import multiprocessing
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Tuple, List
+from typing import Tuple, List, Dict, Iterator, NamedTuple, Sequence
 
 import fitz           # PyMuPDF
 import numpy as np
 from PIL import Image, ImageFilter, ImageOps
 import pytesseract
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:  # xxhash 미설치 시 hashlib.blake2b 사용
+    XXHASH_AVAILABLE = False
+
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:  # tesserocr 미설치 시 pytesseract 사용
+    TESSEROCR_AVAILABLE = False
+
+from ._ocr_kernels import binarize_dilate, scale_boxes
+from .models import ROI, ROI_DPI, roi_rects, roi_tolerances
+from .ocr_cache import OCRCache, file_id, result_key
+
+# 캐시에 보관할 렌더링 페이지 수 (300 DPI A4 한 장 ≈ 25 MB)
+PAGE_CACHE_SIZE = 2
+# 렌더링 DPI 기준 ROI 높이(px)가 이보다 작으면 해당 영역만 ROI_DPI로 다시 렌더링
+HIRES_MIN_HEIGHT = 30
+# 일괄 인식 시 ROI 사이에 넣는 흰 여백(px)
+BATCH_GAP = 40
+# 페이지 병렬 OCR 워커 프로세스 수 (4개를 넘기면 렌더링·메모리 대역폭 경합으로 이득이 거의 없음)
+MAX_WORKERS = min(os.cpu_count() or 1, 4)
+# 여러 PDF 동시 제출 시 결과를 기다리지 않고 미리 제출해 둘 최대 작업 수
+PENDING_CHUNKS = 4 * MAX_WORKERS
+# 열어 둔 채 재사용할 PDF 문서 핸들 수
+DOC_CACHE_SIZE = 2
+# 허용 문자가 지정된 필드(숫자·코드 등)는 사전이 도움이 되지 않으므로 사전 로드 생략
+NO_DICT_VARIABLES = {"load_system_dawg": "0", "load_freq_dawg": "0"}
+# 영역 픽셀 해시 → 인식 결과 캐시 크기 (서로 다른 영역 이미지 수)
+CROP_CACHE_SIZE = 20000
+
+
+# PyMuPDF는 한 프로세스 안에서 여러 스레드가 동시에 사용할 수 없으므로,
+# 메인 프로세스의 fitz 호출(뷰어 선읽기 스레드·GUI 스레드)은 이 잠금으로 직렬화
+FITZ_LOCK = threading.Lock()
+
+PdfSource = str | Path | fitz.Document
+# 페이지 단위 결과: ({단일 필드 이름: 텍스트}, {표 이름: 2D 리스트})
+PageResult = Tuple[Dict[str, str], Dict[str, List[List[str]]]]
+
+
+class _Plan(NamedTuple):
+    # 풀에 제출한 PDF 하나의 인식 계획
+    pages: List[int]
+    rois: List[ROI]
+    keys: Dict[Tuple[int, int], str] | None           # (페이지, ROI 순번) → 캐시 키
+    values: Dict[str, object]                         # 캐시에서 찾은 결과
+    tasks: List[Tuple[List[int], List[int], Future]]  # (ROI 순번, 페이지 묶음, 작업)
+
+
+def _source_key(pdf: PdfSource) -> str:
+    # 캐시 키: 열린 문서는 파일 이름, 그 외에는 경로 문자열
+    return pdf.name if isinstance(pdf, fitz.Document) else str(pdf)
+
+
+def _pixmap_array(pix: fitz.Pixmap) -> np.ndarray:
+    # 그레이스케일 Pixmap → (H, W) uint8 배열 (PNG 인코딩/디코딩 없이 샘플 그대로 사용)
+    return np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.stride)[:, :pix.width]
+
+
+def _group_rows(words) -> List[List[str]]:
+    # (left, top, 텍스트) 단어들 → top이 같은 단어끼리 한 행, 행 안에서는 left 순
+    rows: dict[int, List[tuple[int, str]]] = {}
+    for left, top, text in words:
+        rows.setdefault(top, []).append((left, text))
+    return [
+        [t for _, t in sorted(rows[top], key=lambda x: x[0])]
+        for top in sorted(rows)
+    ]
+
 
 class OCREngine:
     def __init__(
         self,
-        dpi: int = 600,
+        dpi: int = 300,
         lang: str = "kor+eng",
         psm: int = 6,
-        oem: int = 3,
-        whitelist: str = ""
+        oem: int = 1,
+        whitelist: str = "",
+        cache: OCRCache | None = None
     ) -> None:
         self.dpi = dpi
         self.lang = lang
         self.psm = psm
         self.oem = oem
         self.whitelist = whitelist
+        # 렌더링 행렬 · Tesseract 설정 문자열은 한 번만 생성
+        self._mat = fitz.Matrix(self.dpi / 72, self.dpi / 72)
+        self._hires_mat = fitz.Matrix(ROI_DPI / 72, ROI_DPI / 72)
+        # ROI 좌표(ROI_DPI 픽셀) → 렌더링 페이지 픽셀 배율
+        self._scale = self.dpi / ROI_DPI
+        self._table_config = f"--psm 6 --oem {self.oem}"
+        self._configs: dict[tuple[int | None, str], str] = {}
+        # config 문자열 → (psm, 허용 문자) (tesserocr API 설정용)
+        self._tess_options: dict[str, tuple[int, str]] = {self._table_config: (6, "")}
+        # (언어, 사전 사용 여부) → 열린 tesserocr API (모델은 엔진 수명 동안 한 번만 로드)
+        self._apis: dict[tuple[str, bool], "tesserocr.PyTessBaseAPI"] = {}
+        # tesserocr API는 스레드 안전하지 않으므로 호출을 직렬화
+        self._api_lock = threading.Lock()
+        # (PDF 경로, 페이지) → 렌더링된 페이지 배열 (LRU)
+        self._page_cache: OrderedDict[tuple[str, int], np.ndarray] = OrderedDict()
+        # (절대 경로, 수정 시각) → 열린 PDF 문서 (LRU, 같은 PDF를 다시 해석하지 않음)
+        self._docs: OrderedDict[tuple[str, int], fitz.Document] = OrderedDict()
+        # 병렬 OCR 프로세스 풀 (처음 사용할 때 생성, 이후 실행에서도 재사용)
+        self._pool: ProcessPoolExecutor | None = None
+        # 풀은 추출 작업 스레드(생성)와 GUI 스레드(취소·종료)가 함께 다루므로 잠금
+        self._pool_lock = threading.Lock()
+        # 영역 캐시 세대: 비울 때마다 증가, 워커는 다음 작업에서 세대가 바뀌었으면 비움
+        self._crop_generation = 0
+        # (전처리 영역 해시, 언어, 설정) → 인식 결과 (LRU, 반복되는 양식 영역 재사용)
+        self._crop_cache: OrderedDict[tuple, object] = OrderedDict()
+        # 실행 간 OCR 결과 캐시 (extract_pages_parallel에서 사용)
+        self.cache = cache
+        self._cache_sig = f"{dpi}|{lang}|{psm}|{oem}|{whitelist}"
 
     def _load_image(
         self,
-        pdf_path: str | Path,
+        pdf: PdfSource,
         page_num: int
-    ) -> Image.Image:
-        # PDF 페이지를 PIL 이미지로 변환
-        doc = fitz.open(pdf_path)
-        page = doc[page_num]
-        mat = fitz.Matrix(self.dpi / 72, self.dpi / 72)
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        img = Image.open(io.BytesIO(pix.tobytes()))
+    ) -> np.ndarray:
+        # 같은 페이지의 여러 ROI가 한 번의 렌더링을 공유
+        key = (_source_key(pdf), page_num)
+        img = self._page_cache.get(key)
+        if img is not None:
+            self._page_cache.move_to_end(key)
+            return img
+        img = self._render_page(pdf, page_num)
+        self._page_cache[key] = img
+        while len(self._page_cache) > PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
         return img
 
-    def _preprocess(self, img: Image.Image, tol: int = 0) -> Image.Image:
-        # 그레이스케일 변환
-        gray = img.convert("L")
+    def _document(self, pdf: PdfSource) -> fitz.Document:
+        # 경로로 지정된 PDF는 열린 문서 핸들을 재사용 (파일이 바뀌면 다시 열기)
+        if isinstance(pdf, fitz.Document):
+            return pdf
+        path = Path(pdf).resolve()
+        key = (str(path), path.stat().st_mtime_ns)
+        doc = self._docs.get(key)
+        if doc is not None:
+            self._docs.move_to_end(key)
+            return doc
+        doc = self._docs[key] = fitz.open(path)
+        while len(self._docs) > DOC_CACHE_SIZE:
+            self._docs.popitem(last=False)[1].close()
+        return doc
+
+    def close_documents(self) -> None:
+        """재사용 중인 PDF 문서 핸들을 모두 닫기"""
+        with FITZ_LOCK:
+            while self._docs:
+                self._docs.popitem()[1].close()
+
+    def page_count(self, pdf: PdfSource) -> int:
+        with FITZ_LOCK:
+            return self._document(pdf).page_count
+
+    def _render_page(
+        self,
+        pdf: PdfSource,
+        page_num: int
+    ) -> np.ndarray:
+        # PDF 페이지를 (H, W) 그레이스케일 배열로 변환
+        # (Tesseract도 내부에서 회색조로 바꾸므로 RGB 대비 메모리·복사량 1/3)
+        pix = self._document(pdf)[page_num].get_pixmap(
+            matrix=self._mat, colorspace=fitz.csGRAY, alpha=False
+        )
+        return _pixmap_array(pix)
+
+    def _render_clip(
+        self,
+        pdf: PdfSource,
+        page_num: int,
+        roi: Tuple[int, int, int, int],
+        tolerance: int = 0,
+        dpi: int = ROI_DPI
+    ) -> np.ndarray:
+        # ROI 영역만 dpi(기본 ROI_DPI)로 렌더링 (작은 글자용). 좌표는 ROI_DPI 픽셀 → PDF 포인트로 변환
+        x, y, w, h = (int(v) for v in roi)
+        k = 72 / ROI_DPI
+        clip = fitz.Rect(
+            (x - tolerance) * k, (y - tolerance) * k,
+            (x + w + tolerance) * k, (y + h + tolerance) * k
+        )
+        mat = self._hires_mat if dpi == ROI_DPI else fitz.Matrix(dpi / 72, dpi / 72)
+        page = self._document(pdf)[page_num]
+        pix = page.get_pixmap(
+            matrix=mat, clip=clip & page.rect, colorspace=fitz.csGRAY, alpha=False
+        )
+        return _pixmap_array(pix)
+
+    def _needs_hires(self, h: int) -> bool:
+        return self.dpi < ROI_DPI and h * self._scale < HIRES_MIN_HEIGHT
+
+    def _roi_dpi(self, dpi: int, h: int) -> int:
+        # ROI가 원하는 인식 DPI (0이면 엔진 기본값, 작은 글자는 최소 ROI_DPI)
+        dpi = dpi or self.dpi
+        if self._needs_hires(h):
+            dpi = max(dpi, ROI_DPI)
+        return dpi
+
+    def _roi_pixels(
+        self,
+        pdf: PdfSource,
+        page_num: int,
+        img: np.ndarray,
+        dpi: int,
+        rect: Sequence[int],
+        tol: int,
+        box: Sequence[int]
+    ) -> np.ndarray:
+        """
+        ROI 영역 픽셀 준비. 페이지는 엔진 DPI로 한 번만 렌더링하고,
+        더 높은 DPI가 필요한 ROI만 영역 렌더링, 더 낮은 DPI의 ROI는 축소합니다.
+        box: 엔진 DPI 페이지 기준 [x0, y0, x1, y1]
+        """
+        dpi = self._roi_dpi(dpi, rect[3])
+        if dpi > self.dpi:
+            return self._render_clip(pdf, page_num, rect, tol, dpi)
+        x0, y0, x1, y1 = box
+        cropped = img[y0:y1, x0:x1]
+        if dpi < self.dpi and cropped.size:
+            # 픽셀 수가 DPI 제곱에 비례하므로 축소하면 Tesseract 처리량이 줄어듦
+            k = dpi / self.dpi
+            im = Image.fromarray(np.ascontiguousarray(cropped))
+            size = (max(1, round(im.width * k)), max(1, round(im.height * k)))
+            cropped = np.asarray(im.resize(size, Image.BOX))
+        return cropped
+
+    def clear_page_cache(self, pdf: PdfSource | None = None) -> None:
+        """렌더링 캐시 비우기 (pdf 지정 시 해당 PDF 페이지만)"""
+        if pdf is None:
+            self._page_cache.clear()
+            return
+        name = _source_key(pdf)
+        for key in [k for k in self._page_cache if k[0] == name]:
+            del self._page_cache[key]
+
+    def _preprocess(self, arr: np.ndarray, tol: int = 0) -> Image.Image:
+        # 렌더링이 이미 그레이스케일 (잘라낸 영역만 PIL로 복사)
+        gray = Image.fromarray(np.ascontiguousarray(arr))
         # 가우시안 블러
         blurred = gray.filter(ImageFilter.GaussianBlur(radius=1))
-        # NumPy 배열로 thresholding
-        np_img = np.array(blurred)
-        thresh = np.mean(np_img)
-        bin_arr = (np_img > thresh).astype(np.uint8) * 255
-        bin_img = Image.fromarray(bin_arr)
-        # 팽창(Dilation)으로 획 강화
-        bin_img = bin_img.filter(ImageFilter.MaxFilter(3))
-        return bin_img
+        # 평균 임계값 이진화 + 팽창(Dilation)으로 획 강화 (한 번의 순회)
+        bin_arr = binarize_dilate(np.asarray(blurred))
+        return Image.fromarray(bin_arr)
 
     def extract_roi(
         self,
-        pdf_path: str | Path,
+        pdf: PdfSource,
         page_num: int,
         roi: Tuple[int, int, int, int],
-        tolerance: int = 0
+        tolerance: int = 0,
+        lang: str = "",
+        whitelist: str = "",
+        dpi: int = 0
     ) -> str:
         """
         단일 필드 OCR
-        roi=(x,y,w,h), tolerance 픽셀 여유 영역
+        roi=(x,y,w,h), tolerance 픽셀 여유 영역 (ROI_DPI 기준 픽셀 좌표)
+        lang/whitelist: ROI별 언어·허용 문자 (허용 문자 지정 시 한 줄 모드 --psm 7)
+        dpi: ROI별 인식 DPI (0이면 엔진 기본값)
         """
-        img = self._load_image(pdf_path, page_num)
+        img = self._load_image(pdf, page_num)
+        x, y, w, h = self._scale_roi(roi)
+        t = round(tolerance * self._scale)
+        box = (max(0, x - t), max(0, y - t),
+               min(img.shape[1], x + w + t), min(img.shape[0], y + h + t))
+        cropped = self._roi_pixels(pdf, page_num, img, dpi, roi, tolerance, box)
+        proc = self._preprocess(cropped, tolerance)
+        lang = lang or self.lang
+        config = self._config(7 if whitelist else None, whitelist)
+        key = self._crop_key(proc, lang, config)
+        text = self._crop_cached(key)
+        if text is None:
+            text = self._image_to_string(proc, lang, config).strip()
+            self._crop_store(key, text)
+        return text
+
+    def extract_rois(
+        self,
+        pdf: PdfSource,
+        page_num: int,
+        rois: Sequence[ROI],
+        rects: np.ndarray | None = None,
+        tols: np.ndarray | None = None
+    ) -> Dict[str, str]:
+        """
+        한 페이지의 단일 필드 ROI들을 일괄 인식 → {ROI 이름: 텍스트}
+        언어/허용 문자 설정이 같은 ROI끼리 묶어 묶음당 Tesseract 1회만 호출합니다.
+        rects: rois 와 같은 순서의 (N, 4) [x, y, w, h] 배열 (ROISet.rects 재사용 시)
+        tols: rois 와 같은 순서의 (N,) 오차 배열 (여러 페이지에서 재사용 시)
+        """
+        if not rois:
+            return {}
+        img = self._load_image(pdf, page_num)
+        if rects is None:
+            rects = roi_rects(rois)
+        if tols is None:
+            tols = roi_tolerances(rois)
+        # ROI 좌표(ROI_DPI) → 렌더링 DPI 픽셀, 페이지 경계로 자르기 (일괄 계산)
+        boxes = scale_boxes(rects, tols, self._scale, img.shape[1], img.shape[0])
+        # 묶음 안의 ROI는 페이지 위→아래, 왼→오른쪽 순서로 이어 붙임
+        # (캔버스 배치가 실제 문서 흐름과 같아져 레이아웃 분석이 안정적)
+        order = np.lexsort((rects[:, 0], rects[:, 1])).tolist()
+        groups: dict[tuple[str, str], List[int]] = {}
+        for idx in order:
+            r = rois[idx]
+            groups.setdefault((r.ocr_lang or self.lang, r.ocr_whitelist), []).append(idx)
+
+        result: Dict[str, str] = {}
+        for (lang, whitelist), group in groups.items():
+            crops = []
+            for idx in group:
+                cropped = self._roi_pixels(
+                    pdf, page_num, img, rois[idx].dpi, rects[idx], tols[idx], boxes[idx]
+                )
+                crops.append(self._preprocess(cropped, rois[idx].tolerance))
+            # 허용 문자가 지정된 필드(숫자 등)는 한 줄로 보고 가로로 이어 붙여 --psm 7
+            single_line = bool(whitelist)
+            config = self._config(7 if single_line else self.psm, whitelist)
+            # 이전에 같은 픽셀로 인식한 영역은 결과 재사용, 나머지만 Tesseract로 인식
+            keys = [self._crop_key(c, lang, config) for c in crops]
+            missing: List[int] = []
+            for i, (idx, key) in enumerate(zip(group, keys)):
+                text = self._crop_cached(key)
+                if text is None:
+                    missing.append(i)
+                else:
+                    result[rois[idx].name] = text
+            if not missing:
+                continue
+            texts = self._ocr_batch(
+                [crops[i] for i in missing], lang, config, horizontal=single_line
+            )
+            for i, text in zip(missing, texts):
+                result[rois[group[i]].name] = text
+                self._crop_store(keys[i], text)
+        return result
+
+    def _ocr_batch(
+        self,
+        crops: List[Image.Image],
+        lang: str,
+        config: str,
+        horizontal: bool = False
+    ) -> List[str]:
+        """
+        전처리한 ROI들을 한 번에 인식하고 ROI별로 줄 단위 텍스트를 만듭니다.
+        """
+        result: List[str] = []
+        for words in self._ocr_words(crops, lang, config, horizontal):
+            # 줄 단위 그룹화: {(block, par, line): [단어, ...]}
+            lines: dict[tuple[int, int, int], List[str]] = {}
+            for line_key, _, _, text in words:
+                lines.setdefault(line_key, []).append(text)
+            result.append("\n".join(" ".join(w) for w in lines.values()))
+        return result
+
+    def _ocr_words(
+        self,
+        crops: List[Image.Image],
+        lang: str,
+        config: str,
+        horizontal: bool = False
+    ) -> List[List[tuple[tuple[int, int, int], int, int, str]]]:
+        """
+        전처리한 ROI들을 흰 여백을 두고 이어 붙여 image_to_data 1회로 인식하고,
+        단어의 위치(세로 또는 가로 구간)로 ROI별 단어 목록을 다시 나눕니다.
+        → ROI별 [((block, par, line), left, top, 텍스트)] (좌표는 ROI 기준)
+        """
+        if horizontal:
+            width = sum(c.width for c in crops) + (len(crops) + 1) * BATCH_GAP
+            height = max(c.height for c in crops) + 2 * BATCH_GAP
+        else:
+            width = max(c.width for c in crops) + 2 * BATCH_GAP
+            height = sum(c.height for c in crops) + (len(crops) + 1) * BATCH_GAP
+        canvas = Image.new("L", (width, height), 255)
+        bands: List[tuple[int, int]] = []
+        offset = BATCH_GAP
+        for c in crops:
+            if horizontal:
+                canvas.paste(c, (offset, BATCH_GAP))
+                size = c.width
+            else:
+                canvas.paste(c, (BATCH_GAP, offset))
+                size = c.height
+            bands.append((offset, offset + size))
+            offset += size + BATCH_GAP
+
+        data = self._image_to_data(canvas, lang, config)
+        pos_key, size_key = ('left', 'width') if horizontal else ('top', 'height')
+        words: List[List[tuple[tuple[int, int, int], int, int, str]]] = [[] for _ in crops]
+        for i in range(len(data['level'])):
+            text = data['text'][i].strip()
+            if not text:
+                continue
+            center = data[pos_key][i] + data[size_key][i] // 2
+            for idx, (b0, b1) in enumerate(bands):
+                if b0 - BATCH_GAP // 2 <= center < b1 + BATCH_GAP // 2:
+                    key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+                    if horizontal:
+                        left, top = data['left'][i] - b0, data['top'][i] - BATCH_GAP
+                    else:
+                        left, top = data['left'][i] - BATCH_GAP, data['top'][i] - b0
+                    words[idx].append((key, left, top, text))
+                    break
+        return words
+
+    # ─────────────────────────────────────────
+    # 영역 픽셀 해시 캐시
+    # ─────────────────────────────────────────
+    @staticmethod
+    def _crop_key(img: Image.Image, lang: str, config: str, kind: str = "text") -> tuple:
+        # 전처리된(이진화) 영역 픽셀 + 크기 + 인식 설정 + 결과 종류(텍스트/표)로 키 생성
+        raw = img.tobytes()
+        if XXHASH_AVAILABLE:
+            digest = xxhash.xxh3_128_digest(raw)
+        else:
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+        return (kind, digest, img.size, lang, config)
+
+    def _crop_cached(self, key: tuple):
+        value = self._crop_cache.get(key)
+        if value is not None:
+            self._crop_cache.move_to_end(key)
+        return value
+
+    def _crop_store(self, key: tuple, value) -> None:
+        self._crop_cache[key] = value
+        if len(self._crop_cache) > CROP_CACHE_SIZE:
+            self._crop_cache.popitem(last=False)
+
+    def clear_crop_cache(self) -> None:
+        """영역 픽셀 해시 캐시 비우기"""
+        self._crop_cache.clear()
+
+    def _crop(
+        self,
+        img: np.ndarray,
+        roi: Tuple[int, int, int, int],
+        tolerance: int = 0
+    ) -> np.ndarray:
+        # 오차(tolerance)만큼 넓힌 영역을 페이지 경계 안에서 잘라냄
         x, y, w, h = roi
         x0 = max(0, x - tolerance)
         y0 = max(0, y - tolerance)
-        x1 = min(img.width, x + w + tolerance)
-        y1 = min(img.height, y + h + tolerance)
-        cropped = img.crop((x0, y0, x1, y1))
-        proc = self._preprocess(cropped, tolerance)
-        # Tesseract config
-        config = f"--psm {self.psm} --oem {self.oem}"
-        if self.whitelist:
-            config += f" -c tessedit_char_whitelist={self.whitelist}"
-        text = pytesseract.image_to_string(
-            proc,
-            lang=self.lang,
-            config=config
-        )
-        return text.strip()
+        x1 = min(img.shape[1], x + w + tolerance)
+        y1 = min(img.shape[0], y + h + tolerance)
+        return img[y0:y1, x0:x1]
+
+    def _scale_roi(self, roi: Tuple[int, int, int, int]) -> Tuple[int, int, int, int]:
+        # ROI 좌표(ROI_DPI 픽셀) → 렌더링 DPI 픽셀
+        k = self._scale
+        return tuple(round(v * k) for v in roi)
+
+    def _config(self, psm: int | None = None, whitelist: str = "") -> str:
+        # Tesseract config (ROI별 허용 문자가 없으면 엔진 기본값 사용, 조합별로 캐시)
+        key = (psm, whitelist)
+        config = self._configs.get(key)
+        if config is None:
+            psm = self.psm if psm is None else psm
+            config = f"--psm {psm} --oem {self.oem}"
+            whitelist = whitelist or self.whitelist
+            if whitelist:
+                config += f" -c tessedit_char_whitelist={whitelist}"
+                config += "".join(f" -c {k}={v}" for k, v in NO_DICT_VARIABLES.items())
+            self._configs[key] = config
+            self._tess_options[config] = (psm, whitelist)
+        return config
+
+    # ─────────────────────────────────────────
+    # Tesseract 호출 (tesserocr 우선, 없으면 pytesseract)
+    # ─────────────────────────────────────────
+    def _api(self, lang: str, config: str) -> "tesserocr.PyTessBaseAPI":
+        # 언어별 API를 처음 사용할 때 한 번만 생성하고, 호출마다 psm·허용 문자만 바꿈
+        # 사전 로드 여부는 초기화 때만 지정할 수 있으므로 허용 문자 필드용 API를 따로 둠
+        psm, whitelist = self._tess_options[config]
+        key = (lang, bool(whitelist))
+        api = self._apis.get(key)
+        if api is None:
+            api = self._apis[key] = tesserocr.PyTessBaseAPI(
+                lang=lang,
+                oem=self.oem,
+                variables=NO_DICT_VARIABLES if whitelist else {}
+            )
+        api.SetPageSegMode(psm)
+        api.SetVariable("tessedit_char_whitelist", whitelist)
+        return api
+
+    def _image_to_string(self, img: Image.Image, lang: str, config: str) -> str:
+        if not TESSEROCR_AVAILABLE:
+            return pytesseract.image_to_string(img, lang=lang, config=config)
+        with self._api_lock:
+            api = self._api(lang, config)
+            api.SetImage(img)
+            return api.GetUTF8Text()
+
+    def _image_to_data(self, img: Image.Image, lang: str, config: str) -> dict:
+        """
+        단어 단위 인식 결과를 pytesseract.image_to_data(DICT)와 같은 형식으로 반환
+        (level, text, left, top, width, height, block_num, par_num, line_num)
+        """
+        if not TESSEROCR_AVAILABLE:
+            return pytesseract.image_to_data(
+                img, lang=lang, config=config, output_type=pytesseract.Output.DICT
+            )
+        RIL = tesserocr.RIL
+        keys = ('level', 'text', 'left', 'top', 'width', 'height',
+                'block_num', 'par_num', 'line_num')
+        data: dict[str, list] = {k: [] for k in keys}
+        with self._api_lock:
+            api = self._api(lang, config)
+            api.SetImage(img)
+            api.Recognize()
+            it = api.GetIterator()
+            if it is None:
+                return data
+            block = par = line = 0
+            for word in tesserocr.iterate_level(it, RIL.WORD):
+                # 블록·문단·줄 시작 여부로 pytesseract와 같은 번호를 매김
+                if word.IsAtBeginningOf(RIL.BLOCK):
+                    block, par, line = block + 1, 0, 0
+                if word.IsAtBeginningOf(RIL.PARA):
+                    par, line = par + 1, 0
+                if word.IsAtBeginningOf(RIL.TEXTLINE):
+                    line += 1
+                box = word.BoundingBox(RIL.WORD)
+                if box is None:
+                    continue
+                x0, y0, x1, y1 = box
+                for k, v in zip(keys, (5, word.GetUTF8Text(RIL.WORD) or "", x0, y0,
+                                       x1 - x0, y1 - y0, block, par, line)):
+                    data[k].append(v)
+        return data
+
+    def close_apis(self) -> None:
+        """열린 tesserocr API 해제"""
+        with self._api_lock:
+            for api in self._apis.values():
+                api.End()
+            self._apis.clear()
 
     def extract_table(
         self,
-        pdf_path: str | Path,
+        pdf: PdfSource,
         page_num: int,
         roi: Tuple[int, int, int, int]
     ) -> List[List[str]]:
         """
         테이블 영역 OCR → 2D 리스트 반환
-        pytesseract.image_to_data로 셀 감지
+        단어 위치(image_to_data)로 셀 감지
         """
-        img = self._load_image(pdf_path, page_num)
-        x, y, w, h = roi
-        cropped = img.crop((x, y, x + w, y + h))
+        img = self._load_image(pdf, page_num)
+        cropped = self._crop(img, self._scale_roi(roi))
         proc = self._preprocess(cropped)
-        config = f"--psm 6 --oem {self.oem}"
-        data = pytesseract.image_to_data(
-            proc,
-            lang=self.lang,
-            config=config,
-            output_type=pytesseract.Output.DICT
+        data = self._image_to_data(proc, self.lang, self._table_config)
+        return _group_rows(
+            (data['left'][i], data['top'][i], data['text'][i].strip())
+            for i in range(len(data['level']))
+            if data['text'][i].strip()
         )
-        # 행 단위 그룹화
-        n_boxes = len(data['level'])
-        rows: dict[int, List[tuple[int, str]]] = {}
-        for i in range(n_boxes):
-            text = data['text'][i].strip()
-            if not text:
-                continue
-            top = data['top'][i]
-            left = data['left'][i]
-            # row key based on top coordinate
-            rows.setdefault(top, []).append((left, text))
-        table: List[List[str]] = []
-        for top in sorted(rows.keys()):
-            cells = [t for _, t in sorted(rows[top], key=lambda x: x[0])]
-            table.append(cells)
-        return table
+
+    def extract_tables(
+        self,
+        pdf: PdfSource,
+        page_num: int,
+        rois: Sequence[ROI],
+        rects: np.ndarray | None = None
+    ) -> Dict[str, List[List[str]]]:
+        """
+        한 페이지의 표 형식 ROI들을 Tesseract 1회로 일괄 인식 → {ROI 이름: 2D 리스트}
+        rects: rois 와 같은 순서의 (N, 4) [x, y, w, h] 배열
+        """
+        if not rois:
+            return {}
+        img = self._load_image(pdf, page_num)
+        if rects is None:
+            rects = roi_rects(rois)
+        # 표 영역은 오차 없이 잘라냄 (일괄 계산)
+        boxes = scale_boxes(
+            rects, np.zeros(len(rois), dtype=np.int32), self._scale, img.shape[1], img.shape[0]
+        )
+        crops = [
+            self._preprocess(self._roi_pixels(pdf, page_num, img, r.dpi, rect, 0, box))
+            for r, rect, box in zip(rois, rects, boxes)
+        ]
+        keys = [self._crop_key(c, self.lang, self._table_config, "table") for c in crops]
+        tables = [self._crop_cached(key) for key in keys]
+        missing = [i for i, t in enumerate(tables) if t is None]
+        if missing:
+            words = self._ocr_words([crops[i] for i in missing], self.lang, self._table_config)
+            for i, roi_words in zip(missing, words):
+                tables[i] = _group_rows((left, top, text) for _, left, top, text in roi_words)
+                self._crop_store(keys[i], tables[i])
+        # 캐시된 표를 호출자가 수정해도 영향이 없도록 행 단위 복사
+        return {r.name: [row[:] for row in t] for r, t in zip(rois, tables)}
+
+    def extract_pages(
+        self,
+        pdf: PdfSource,
+        pages: Sequence[int],
+        rois: Sequence[ROI],
+        rects: np.ndarray | None = None
+    ) -> List[PageResult]:
+        """
+        여러 페이지를 순서대로 인식 → 페이지별 (단일 필드 결과, 표 결과) 리스트
+        rects: rois 와 같은 순서의 (N, 4) [x, y, w, h] 배열
+        """
+        if rects is None:
+            rects = roi_rects(rois)
+        # ROI 좌표·오차 배열은 페이지마다 다시 만들지 않고 한 번만 나눔
+        single_idx = [i for i, r in enumerate(rois) if r.field_type == 'single']
+        table_idx = [i for i, r in enumerate(rois) if r.field_type == 'table']
+        singles = [rois[i] for i in single_idx]
+        tables = [rois[i] for i in table_idx]
+        single_rects = rects[single_idx]
+        single_tols = roi_tolerances(singles)
+        table_rects = rects[table_idx]
+
+        doc = self._document(pdf)
+        try:
+            results: List[PageResult] = []
+            for page_num in pages:
+                texts = self.extract_rois(doc, page_num, singles, single_rects, single_tols)
+                table_values = self.extract_tables(doc, page_num, tables, table_rects)
+                results.append((texts, table_values))
+            return results
+        finally:
+            self.clear_page_cache(doc)
+
+    def extract_pages_parallel(
+        self,
+        pdf_path: str | Path,
+        pages: Sequence[int],
+        rois: Sequence[ROI],
+        rects: np.ndarray | None = None
+    ) -> Dict[int, PageResult]:
+        """
+        페이지들을 워커 프로세스에 나누어 병렬 인식 → {페이지 번호: 페이지 결과}
+        각 워커는 자신의 OCREngine으로 PDF를 한 번 열어 맡은 페이지 묶음을 처리합니다.
+        cache가 있으면 이전 실행에서 인식한 (페이지, ROI)는 건너뛰고 나머지만 인식합니다.
+        """
+        if rects is None:
+            rects = roi_rects(rois)
+        return self._collect(self._submit(pdf_path, list(pages), rois, rects))
+
+    def extract_pdfs_parallel(
+        self,
+        jobs: Sequence[Tuple[str | Path, int]],
+        rois: Sequence[ROI],
+        rects: np.ndarray | None = None
+    ) -> Iterator[Dict[int, PageResult]]:
+        """
+        여러 PDF [(경로, 페이지 수), ...]의 페이지를 한 프로세스 풀에 함께 제출하고
+        입력 순서대로 PDF별 {페이지 번호: 페이지 결과}를 내보냅니다.
+        (페이지가 적은 PDF가 많아도 워커들이 다음 PDF를 미리 처리)
+        대기 중인 작업이 PENDING_CHUNKS 미만일 때만 다음 PDF를 제출해 결과가 쌓이지 않게 합니다.
+        """
+        if rects is None:
+            rects = roi_rects(rois)
+        plans: deque[_Plan] = deque()
+        remaining = iter(jobs)
+        pending = 0
+        try:
+            while True:
+                # 앞선 PDF를 기다리는 동안 다음 PDF들의 페이지를 미리 제출
+                while pending < PENDING_CHUNKS:
+                    job = next(remaining, None)
+                    if job is None:
+                        break
+                    pdf_path, page_count = job
+                    plan = self._submit(pdf_path, list(range(page_count)), rois, rects)
+                    plans.append(plan)
+                    pending += len(plan.tasks)
+                if not plans:
+                    return
+                plan = plans.popleft()
+                pending -= len(plan.tasks)
+                yield self._collect(plan)
+        finally:
+            # 중단(취소·오류) 시 아직 시작하지 않은 작업은 버림
+            for plan in plans:
+                for _, _, future in plan.tasks:
+                    future.cancel()
+
+    def _submit(
+        self,
+        pdf_path: str | Path,
+        pages: List[int],
+        rois: Sequence[ROI],
+        rects: np.ndarray
+    ) -> _Plan:
+        # 캐시 조회 후 누락된 (페이지, ROI)만 페이지 묶음 단위로 풀에 제출
+        keys: Dict[Tuple[int, int], str] | None = None
+        values: Dict[str, object] = {}
+        groups: Dict[Tuple[int, ...], List[int]] = {}
+        if self.cache is None:
+            if pages:
+                groups[tuple(range(len(rois)))] = pages
+        else:
+            fid = file_id(pdf_path)
+            keys = {
+                (page, i): result_key(fid, page, self._cache_sig, r)
+                for page in pages for i, r in enumerate(rois)
+            }
+            values = self.cache.get_many(keys.values())
+            # 누락된 ROI 조합이 같은 페이지끼리 묶어 필요한 ROI만 인식
+            for page in pages:
+                missing = tuple(i for i in range(len(rois)) if keys[page, i] not in values)
+                if missing:
+                    groups.setdefault(missing, []).append(page)
+
+        tasks: List[Tuple[List[int], List[int], Future]] = []
+        pool = self._get_pool() if groups else None
+        for missing, group_pages in groups.items():
+            idx = list(missing)
+            sub_rois = [rois[i] for i in idx]
+            sub_rects = rects[idx]
+            chunksize = max(1, len(group_pages) // (4 * MAX_WORKERS))
+            for i in range(0, len(group_pages), chunksize):
+                chunk = group_pages[i:i + chunksize]
+                future = pool.submit(
+                    _ocr_pages, str(pdf_path), chunk, sub_rois, sub_rects,
+                    self._crop_generation
+                )
+                tasks.append((idx, chunk, future))
+        return _Plan(pages, list(rois), keys, values, tasks)
+
+    def _collect(self, plan: _Plan) -> Dict[int, PageResult]:
+        # 제출한 작업 결과를 모아 캐시에 저장하고 페이지 순서대로 결과 구성
+        rois = plan.rois
+        if plan.keys is None:
+            found: Dict[int, PageResult] = {}
+            for _, chunk, future in plan.tasks:
+                found.update(zip(chunk, future.result()))
+            return {page: found[page] for page in plan.pages}
+
+        keys, values = plan.keys, plan.values
+        fresh: Dict[str, object] = {}
+        for idx, chunk, future in plan.tasks:
+            for page, (texts, tables) in zip(chunk, future.result()):
+                for i in idx:
+                    r = rois[i]
+                    if r.field_type == 'single':
+                        fresh[keys[page, i]] = texts.get(r.name, "")
+                    else:
+                        fresh[keys[page, i]] = tables.get(r.name, [])
+        self.cache.set_many(fresh)
+        values.update(fresh)
+
+        results: Dict[int, PageResult] = {}
+        for page in plan.pages:
+            texts: Dict[str, str] = {}
+            tables: Dict[str, List[List[str]]] = {}
+            for i, r in enumerate(rois):
+                if r.field_type == 'single':
+                    texts[r.name] = values[keys[page, i]]
+                else:
+                    tables[r.name] = values[keys[page, i]]
+            results[page] = (texts, tables)
+        return results
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                options = dict(
+                    dpi=self.dpi, lang=self.lang, psm=self.psm,
+                    oem=self.oem, whitelist=self.whitelist
+                )
+                # Qt(GUI·작업 스레드) 프로세스를 fork하지 않도록 항상 spawn 사용
+                self._pool = ProcessPoolExecutor(
+                    max_workers=MAX_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(options,)
+                )
+            return self._pool
+
+    def _take_pool(self) -> ProcessPoolExecutor | None:
+        # 풀을 떼어 내 반환 (종료 대기는 잠금 밖에서)
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        return pool
+
+    def clear_all_crop_caches(self) -> None:
+        """
+        이 엔진과 워커 프로세스들의 영역 픽셀 해시 캐시를 모두 비우기
+        (워커는 세대 번호가 바뀐 것을 보고 다음 페이지 묶음을 처리하기 전에 비움)
+        """
+        self.clear_crop_cache()
+        self._crop_generation += 1
+
+    def cancel_pending(self) -> None:
+        """
+        아직 시작하지 않은 병렬 OCR 작업을 모두 취소 (실행 중인 페이지 묶음은 끝까지 처리)
+        풀은 기다리지 않고 종료하며, 다음 실행 때 새로 생성합니다.
+        """
+        pool = self._take_pool()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """병렬 OCR 프로세스 풀 종료, 열린 PDF 문서·Tesseract API 닫기"""
+        pool = self._take_pool()
+        if pool is not None:
+            pool.shutdown()
+        self.close_documents()
+        self.close_apis()
+
+
+# ─────────────────────────────────────────────
+# 워커 프로세스 (프로세스마다 OCREngine·Tesseract API 1개)
+# ─────────────────────────────────────────────
+_worker_engine: OCREngine | None = None
+# 이 워커가 마지막으로 본 영역 캐시 세대 (OCREngine._crop_generation)
+_worker_generation = 0
+
+
+def _init_worker(options: dict) -> None:
+    global _worker_engine
+    _worker_engine = OCREngine(**options)
+
+
+def _ocr_pages(
+    pdf_path: str,
+    pages: List[int],
+    rois: List[ROI],
+    rects: np.ndarray,
+    generation: int
+) -> List[PageResult]:
+    global _worker_generation
+    if generation != _worker_generation:
+        # 메인 프로세스에서 캐시 비우기를 요청한 뒤의 첫 작업
+        _worker_engine.clear_crop_cache()
+        _worker_generation = generation
+    try:
+        # 묶음 안의 페이지들은 PDF를 한 번만 열어 공유
+        return _worker_engine.extract_pages(pdf_path, pages, rois, rects)
+    finally:
+        # 작업이 끝나면 문서를 닫아 실행 사이에 워커가 PDF 파일을 붙잡지 않음
+        _worker_engine.close_documents()
@@ -5,17 +5,22 @@ ROIManager
 • ROI 세트(ROISet)를 JSON 파일 하나로 영속화
 • CRUD(생성·조회·수정·삭제) API 제공
 • 스레드 안전성을 위해 모든 I/O 는 내부 Lock 사용
+• 저장은 임시 파일 → os.replace 로 원자적으로 수행
+• 로드는 백그라운드 스레드에서 수행, 조회·수정 API는 로드 완료까지 대기
 """
 
 from __future__ import annotations
 
-import json
+import logging
 import threading
 from pathlib import Path
 from typing import List, Dict
 
+from .json_io import atomic_write, dumps, loads
 from .models import ROI, ROISet
 
+logger = logging.getLogger(__name__)
+
 # ─────────────────────────────────────────────
 # 설정: 프로젝트 폴더에 `roi_sets.json` 저장
 # ─────────────────────────────────────────────
@@ -26,7 +31,7 @@ DATA_PATH = ROOT_DIR / "roi_sets.json"
 # 파일이 없으면 생성
 DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
 if not DATA_PATH.exists():
-    DATA_PATH.write_text(json.dumps({"sets": []}, ensure_ascii=False, indent=2), encoding="utf-8")
+    DATA_PATH.write_bytes(dumps({"sets": []}))
 
 class ROIManager:
     """
@@ -38,48 +43,65 @@ class ROIManager:
     
     def __init__(self) -> None:
         self._sets: Dict[str, ROISet] = {}
-        self._load()
+        # JSON 로드는 백그라운드에서 수행 (UI 초기화와 병행), 조회 API는 완료까지 대기
+        self._ready = threading.Event()
+        self._load_thread = threading.Thread(target=self._load_async, daemon=True)
+        self._load_thread.start()
+
+    def _load_async(self) -> None:
+        try:
+            self._load()
+        finally:
+            self._ready.set()
 
     def _load(self) -> None:
         """JSON → 메모리"""
-        # 디버그: 실제 로드 경로 출력
-        print(f"[ROIManager] Loading ROI sets from: {DATA_PATH}")
+        logger.debug("Loading ROI sets from: %s", DATA_PATH)
         try:
-            data = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+            data = loads(DATA_PATH.read_bytes())
             # 데이터 파싱 및 메모리에 저장
             for d in data.get("sets", []):
                 rs = ROISet.from_dict(d)
                 self._sets[rs.set_name] = rs
-            # 디버그: 로드된 세트와 ROI 출력
-            print(f"[ROIManager] Loaded sets:")
-            for name, rs in self._sets.items():
-                print(f"  - Set: {name}")
-                for roi in rs.rois:
-                    print(f"    ROI '{roi.name}': x={roi.x}, y={roi.y}, w={roi.w}, h={roi.h}")
+            # 디버그: 로드된 세트와 ROI (DEBUG 수준일 때만 문자열 생성)
+            if logger.isEnabledFor(logging.DEBUG):
+                lines = ["Loaded sets:"]
+                for name, rs in self._sets.items():
+                    lines.append(f"  - Set: {name}")
+                    lines.extend(
+                        f"    ROI '{roi.name}': x={roi.x}, y={roi.y}, w={roi.w}, h={roi.h}"
+                        for roi in rs.rois
+                    )
+                logger.debug("\n".join(lines))
         except Exception as e:
-            print(f"[ROIManager] JSON load error: {e}")
+            logger.error("JSON load error: %s", e)
 
     def _save(self) -> None:
         """메모리 → JSON (pretty-print, 한글 보존)"""
         data = {"sets": [rs.to_dict() for rs in self._sets.values()]}
-        DATA_PATH.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2),
-            encoding="utf-8"
-        )
+        atomic_write(DATA_PATH, dumps(data))
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """JSON 로드가 끝날 때까지 대기 (끝났으면 True)"""
+        return self._ready.wait(timeout)
 
     # CRUD API
     def list_sets(self) -> List[str]:
+        self._ready.wait()
         return list(self._sets.keys())
 
     def get_set(self, name: str) -> ROISet | None:
+        self._ready.wait()
         return self._sets.get(name)
 
     def upsert_set(self, rs: ROISet) -> None:
+        self._ready.wait()
         with self._lock:
             self._sets[rs.set_name] = rs
             self._save()
 
     def delete_set(self, name: str) -> None:
+        self._ready.wait()
         with self._lock:
             if name in self._sets:
                 del self._sets[name]
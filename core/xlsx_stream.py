@@ -0,0 +1,122 @@
+# core/xlsx_stream.py
+"""
+최소 .xlsx 스트리밍 작성기
+────────────────────────
+• 시트 XML(<row>/<c>)을 zip 항목에 직접 스트리밍 → 셀 객체 모델·서식 처리 없음
+• 문자열은 inlineStr 셀로 기록 (공유 문자열 표 관리 불필요)
+• 행은 증가하는 순서로만 기록 (ExcelWriter.flush_until 순서와 동일)
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+# XML 1.0에서 허용되지 않는 제어 문자 (OCR 결과에 섞여 들어오는 경우 제거)
+_ILLEGAL_XML = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+# Excel이 요구하는 최소 서식 (기본 글꼴·채우기·테두리·셀 서식·표준 스타일)
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_TAIL = '</sheetData></worksheet>'
+
+
+@lru_cache(maxsize=1024)
+def _column_letter(col: int) -> str:
+    # 1부터 시작하는 열 번호 → 열 문자 (1=A, 27=AA)
+    letters = ""
+    while col:
+        col, rem = divmod(col - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _cell(ref: str, value) -> str:
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    # nan·inf는 숫자 셀로 쓰면 Excel이 손상된 파일로 판단하므로 문자열로 기록
+    if isinstance(value, int) or isinstance(value, float) and math.isfinite(value):
+        return f'<c r="{ref}"><v>{value!r}</v></c>'
+    text = escape(_ILLEGAL_XML.sub("", str(value)))
+    return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+class XlsxStreamWriter:
+    """
+    시트 1개짜리 .xlsx 파일을 행 단위로 스트리밍 기록합니다.
+    write_row 는 증가하는 행 번호로만 호출해야 하며, close() 후 파일이 완성됩니다.
+    """
+    def __init__(self, file_path: Path, sheet_name: str = "Sheet1"):
+        self._zip = zipfile.ZipFile(file_path, "w", zipfile.ZIP_DEFLATED)
+        self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        self._zip.writestr("_rels/.rels", _ROOT_RELS)
+        self._zip.writestr(
+            "xl/workbook.xml", _WORKBOOK.format(name=escape(sheet_name, {'"': "&quot;"}))
+        )
+        self._zip.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        self._zip.writestr("xl/styles.xml", _STYLES)
+        # 시트 XML은 zip 항목에 바로 스트리밍 (크기를 모르므로 zip64 허용)
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", "w", force_zip64=True)
+        self._sheet.write(_SHEET_HEAD.encode("utf-8"))
+
+    def write_row(self, row: int, cells: dict[int, object]) -> None:
+        """row(1부터) 행에 {col: value} 기록. None·빈 문자열은 빈 셀로 둡니다."""
+        parts = [f'<row r="{row}">']
+        for col, value in sorted(cells.items()):
+            if value is not None and value != "":
+                parts.append(_cell(f"{_column_letter(col)}{row}", value))
+        parts.append("</row>")
+        self._sheet.write("".join(parts).encode("utf-8"))
+
+    def close(self) -> None:
+        self._sheet.write(_SHEET_TAIL.encode("utf-8"))
+        self._sheet.close()
+        self._zip.close()
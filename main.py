@@ -7,6 +7,7 @@
 """
 
 import sys
+from multiprocessing import freeze_support
 
 from PySide6.QtWidgets import QApplication
 
@@ -23,4 +24,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # 패키징(PyInstaller/Nuitka)된 실행 파일에서 OCR 워커 프로세스 지원
+    freeze_support()
     main()
@@ -0,0 +1,77 @@
+# tests/test_ocr_cache.py
+# OCRCache의 저장·조회와 오래된 결과 삭제(기간·행 수 제한)를 확인합니다.
+
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core import ocr_cache
+from core.ocr_cache import OCRCache
+
+
+class OCRCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "cache.sqlite3"
+
+    def _open(self) -> OCRCache:
+        cache = OCRCache(self.path)
+        self.addCleanup(cache._conn.close)
+        return cache
+
+    def _last_used(self, cache: OCRCache, key: str) -> int:
+        return cache._conn.execute(
+            "SELECT last_used FROM results WHERE key = ?", (key,)
+        ).fetchone()[0]
+
+    def test_round_trip(self) -> None:
+        cache = self._open()
+        cache.set_many({"a": "텍스트", "b": [["1", "2"]]})
+        self.assertEqual(cache.get_many(["a", "b", "c"]), {"a": "텍스트", "b": [["1", "2"]]})
+
+    def test_get_many_touches_last_used(self) -> None:
+        cache = self._open()
+        cache.set_many({"a": "x"})
+        with cache._conn:
+            cache._conn.execute("UPDATE results SET last_used = 0")
+        cache.get_many(["a"])
+        self.assertGreater(self._last_used(cache, "a"), 0)
+
+    def test_old_entries_are_removed_on_open(self) -> None:
+        cache = self._open()
+        cache.set_many({"old": "x", "new": "y"})
+        old = int(time.time()) - (ocr_cache.CACHE_MAX_AGE_DAYS + 1) * 86400
+        with cache._conn:
+            cache._conn.execute("UPDATE results SET last_used = ? WHERE key = 'old'", (old,))
+        self.assertEqual(self._open().get_many(["old", "new"]), {"new": "y"})
+
+    def test_least_recently_used_are_pruned(self) -> None:
+        cache = self._open()
+        with mock.patch.object(ocr_cache, "CACHE_MAX_ROWS", 10):
+            cache.set_many({f"k{i}": i for i in range(10)})
+            with cache._conn:
+                cache._conn.execute("UPDATE results SET last_used = 1")
+                cache._conn.execute("UPDATE results SET last_used = 2 WHERE key = 'k0'")
+            cache.set_many({"k10": 10})
+        found = cache.get_many(f"k{i}" for i in range(11))
+        self.assertEqual(len(found), 9)
+        self.assertIn("k0", found)
+        self.assertIn("k10", found)
+
+    def test_old_cache_file_is_migrated(self) -> None:
+        conn = sqlite3.connect(str(self.path))
+        with conn:
+            conn.execute("CREATE TABLE results (key TEXT PRIMARY KEY, value BLOB)")
+            conn.execute("INSERT INTO results VALUES ('a', ?)", (ocr_cache.dumps("x"),))
+        conn.close()
+        self.assertEqual(self._open().get_many(["a"]), {"a": "x"})
+
+
+if __name__ == "__main__":
+    unittest.main()
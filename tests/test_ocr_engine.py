@@ -0,0 +1,39 @@
+# tests/test_ocr_engine.py
+# tesserocr 경로(_api → _image_to_string/_image_to_data)를 실제로 한 번 실행해 봅니다.
+
+from __future__ import annotations
+
+import unittest
+
+from PIL import Image, ImageDraw, ImageFont
+
+from core.ocr_engine import TESSEROCR_AVAILABLE, OCREngine
+
+
+def _text_image(text: str) -> Image.Image:
+    img = Image.new("L", (400, 100), 255)
+    ImageDraw.Draw(img).text((20, 20), text, fill=0, font=ImageFont.load_default(size=48))
+    return img
+
+
+@unittest.skipUnless(TESSEROCR_AVAILABLE, "tesserocr 미설치")
+class TesserocrApiTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = OCREngine(lang="eng")
+        self.addCleanup(self.engine.close_apis)
+
+    def test_image_to_string(self) -> None:
+        config = self.engine._config(7, "0123456789")
+        text = self.engine._image_to_string(_text_image("4096"), "eng", config)
+        self.assertEqual(text.strip(), "4096")
+
+    def test_image_to_data(self) -> None:
+        config = self.engine._config(6)
+        data = self.engine._image_to_data(_text_image("OCR 123"), "eng", config)
+        self.assertEqual([t for t in data['text'] if t.strip()], ["OCR", "123"])
+        self.assertEqual(len(data['left']), len(data['text']))
+        self.assertTrue(all(v == 5 for v in data['level']))
+
+
+if __name__ == "__main__":
+    unittest.main()
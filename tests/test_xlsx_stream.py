@@ -0,0 +1,77 @@
+# tests/test_xlsx_stream.py
+# XlsxStreamWriter가 만든 .xlsx를 openpyxl로 다시 읽어 값이 그대로인지 확인합니다.
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+from core.xlsx_stream import XlsxStreamWriter
+
+
+class XlsxStreamRoundTripTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "out.xlsx"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write(self, rows: dict[int, dict[int, object]], sheet_name: str = "Sheet1"):
+        writer = XlsxStreamWriter(self.path, sheet_name)
+        for row, cells in sorted(rows.items()):
+            writer.write_row(row, cells)
+        writer.close()
+        wb = load_workbook(self.path)
+        self.addCleanup(wb.close)
+        return wb
+
+    def test_values_round_trip(self) -> None:
+        ws = self._write({
+            1: {1: "이름", 2: "금액"},
+            2: {1: "홍길동", 2: 1200, 3: 3.5, 4: True},
+            5: {28: "AB열", 703: "AAA열"},
+        }).worksheets[0]
+        self.assertEqual([c.value for c in ws[1]][:2], ["이름", "금액"])
+        self.assertEqual(
+            [ws.cell(2, c).value for c in range(1, 5)], ["홍길동", 1200, 3.5, True]
+        )
+        self.assertEqual(ws["AB5"].value, "AB열")
+        self.assertEqual(ws["AAA5"].value, "AAA열")
+        # 건너뛴 행·빈 값은 빈 셀
+        self.assertIsNone(ws.cell(3, 1).value)
+
+    def test_non_finite_floats_are_written_as_text(self) -> None:
+        cells = {1: float("nan"), 2: float("inf"), 3: float("-inf"), 4: 1.5}
+        ws = self._write({1: cells}).worksheets[0]
+        self.assertEqual([ws.cell(1, c).value for c in range(1, 5)], ["nan", "inf", "-inf", 1.5])
+        self.assertEqual(ws["A1"].data_type, "s")
+
+    def test_xml_special_characters(self) -> None:
+        text = "<a & b> \"따옴표\" 'x' ]]> =1+1"
+        ws = self._write({1: {1: text, 2: "  앞뒤 공백  ", 3: "줄\n바꿈\t탭"}}).worksheets[0]
+        self.assertEqual(ws["A1"].value, text)
+        self.assertEqual(ws["A1"].data_type, "s")
+        self.assertEqual(ws["B1"].value, "  앞뒤 공백  ")
+        self.assertEqual(ws["C1"].value, "줄\n바꿈\t탭")
+
+    def test_control_characters_are_removed(self) -> None:
+        ws = self._write({1: {1: "A\x00B\x08C\x0bD\x1fE\ufffeF"}}).worksheets[0]
+        self.assertEqual(ws["A1"].value, "ABCDEF")
+
+    def test_empty_cells_are_skipped(self) -> None:
+        ws = self._write({1: {1: None, 2: "", 3: "값"}}).worksheets[0]
+        self.assertIsNone(ws["A1"].value)
+        self.assertIsNone(ws["B1"].value)
+        self.assertEqual(ws["C1"].value, "값")
+
+    def test_sheet_name_is_escaped(self) -> None:
+        wb = self._write({1: {1: "x"}}, sheet_name='A&B "1"')
+        self.assertEqual(wb.sheetnames, ['A&B "1"'])
+
+
+if __name__ == "__main__":
+    unittest.main()
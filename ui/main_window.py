@@ -7,12 +7,16 @@ MainWindow
     2) 좌표 편집      (TabEdit)
     3) 제외 규칙 관리 (TabExclusion)
     4) 데이터 추출    (TabExtract)
+• 좌표 세트·제외 규칙 JSON은 백그라운드에서 로드하고, 로드가 끝나면 각 탭을 채움
 • 좌표 세트 변경 시 TabEdit/TabExtract에 실시간 반영
-• 프로그램 종료 시 확인 팝업
+• 프로그램 종료 시 확인 팝업 (추출 작업 중이면 중단 후 종료)
 """
 
 from __future__ import annotations
 
+import threading
+
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QMainWindow, QTabWidget, QWidget, QVBoxLayout, QApplication, QMessageBox
 )
@@ -37,6 +41,9 @@ def main():
 class MainWindow(QMainWindow):
     """애플리케이션 메인 윈도우"""
 
+    # 두 매니저의 JSON 로드 완료 (로드 스레드에서 발생 → GUI 스레드에서 처리)
+    data_loaded = Signal()
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("PDF OCR → Excel 변환기 by Moon")
@@ -51,11 +58,19 @@ class MainWindow(QMainWindow):
         edit_tab      = TabEdit(self.roi_mgr)
         exclusion_tab = TabExclusion(self.ex_mgr)
         extract_tab   = TabExtract(self.roi_mgr, self.ex_mgr)
+        self.extract_tab = extract_tab
 
         # ─ 실시간 세트 변경 연동 ─
         coord_tab.sets_updated.connect(edit_tab.refresh_sets)
         coord_tab.sets_updated.connect(extract_tab.refresh_sets)
 
+        # ─ 로드가 끝나면 탭 채우기 (창 표시를 로드 대기로 막지 않음) ─
+        self.data_loaded.connect(coord_tab.refresh_sets)
+        self.data_loaded.connect(edit_tab.refresh_sets)
+        self.data_loaded.connect(exclusion_tab.populate_table)
+        self.data_loaded.connect(extract_tab.refresh_sets)
+        threading.Thread(target=self._wait_managers, daemon=True).start()
+
         # ─ 탭 위젯 구성 ─
         tabs = QTabWidget()
         tabs.addTab(coord_tab,     "좌표 지정")
@@ -68,18 +83,30 @@ class MainWindow(QMainWindow):
         layout.addWidget(tabs)
         self.setCentralWidget(container)
 
+    def _wait_managers(self) -> None:
+        self.roi_mgr.wait_ready()
+        self.ex_mgr.wait_ready()
+        self.data_loaded.emit()
+
     # ───────────────────────────────
     # 종료 확인
     # ───────────────────────────────
     def closeEvent(self, event) -> None:
+        running = self.extract_tab.is_running()
+        message = (
+            "추출 작업이 진행 중입니다.\n작업을 중단하고 종료하시겠습니까?"
+            if running else "프로그램을 종료하시겠습니까?"
+        )
         reply = QMessageBox.question(
             self,
             "프로그램 종료",
-            "프로그램을 종료하시겠습니까?",
+            message,
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
         if reply == QMessageBox.Yes:
+            # 실행 중인 작업 스레드를 멈추고 끝날 때까지 기다린 뒤 종료
+            self.extract_tab.stop()
             event.accept()
         else:
             event.ignore()
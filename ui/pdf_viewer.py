@@ -1,23 +1,125 @@
 # ui/pdf_viewer.py
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import fitz  # PyMuPDF
-from PySide6.QtCore import Qt, QRect, QRectF, QPoint, QSize
+from PySide6.QtCore import (
+    Qt, QRect, QRectF, QPoint, QSize, QTimer, QObject, QRunnable, QThreadPool, Signal
+)
 from PySide6.QtGui import (
     QImage, QPixmap, QMouseEvent, QWheelEvent, QTransform,
     QPen, QColor, QContextMenuEvent, QAction, QPainter
 )
 from PySide6.QtWidgets import (
-    QGraphicsView, QGraphicsScene, QGraphicsRectItem, QRubberBand,
-    QGraphicsItem, QMenu, QInputDialog, QDialog
+    QGraphicsView, QGraphicsScene, QGraphicsRectItem, QGraphicsPixmapItem,
+    QRubberBand, QGraphicsItem, QMenu, QInputDialog, QDialog, QApplication
 )
 
+from core.models import ROI, ROI_DPI
+from core.ocr_engine import FITZ_LOCK
 from ui.roi_dialog import ROIDialog
 
 
+# ──────────────────────────────────────────────────
+# 0. 페이지 렌더링 캐시  (같은 페이지를 다시 표시할 때 fitz 렌더링 생략)
+# ──────────────────────────────────────────────────
+# 타일 한 변의 크기 (px). 페이지 전체를 한 덩어리로 할당하지 않기 위함
+TILE_SIZE = 1024
+# (x, y, RGB 샘플, 너비, 높이, stride)
+_Tile = Tuple[int, int, bytes, int, int, int]
+# (절대 경로, 수정 시각 ns, 페이지, DPI) → (페이지 너비, 페이지 높이, 타일 목록)
+_RenderKey = Tuple[str, int, int, int]
+_RenderEntry = Tuple[int, int, Tuple[_Tile, ...]]
+_render_cache: "OrderedDict[_RenderKey, _RenderEntry]" = OrderedDict()
+# 캐시 최대 용량 (바이트). 초과 시 오래된 페이지부터 제거
+RENDER_CACHE_BYTES = 256 * 1024 * 1024
+# 캐시는 GUI 스레드에서만 읽고 씀. 선읽기 스레드는 렌더링 결과를 시그널로 넘기고,
+# fitz 호출은 GUI 스레드·선읽기 스레드 모두 FITZ_LOCK 안에서 수행
+
+
+def _entry_bytes(entry: _RenderEntry) -> int:
+    return sum(len(tile[2]) for tile in entry[2])
+
+
+def _render_tiles(page: fitz.Page, dpi: int) -> _RenderEntry:
+    # 디스플레이 리스트로 페이지를 한 번만 해석한 뒤 타일 단위로 래스터화
+    mat = fitz.Matrix(dpi / 72, dpi / 72)
+    inv = ~mat
+    bounds = (page.rect * mat).irect
+    width, height = bounds.width, bounds.height
+    dl = page.get_displaylist()
+    tiles = []
+    for y0 in range(0, height, TILE_SIZE):
+        for x0 in range(0, width, TILE_SIZE):
+            clip = fitz.Rect(
+                x0, y0, min(x0 + TILE_SIZE, width), min(y0 + TILE_SIZE, height)
+            )
+            pix = dl.get_pixmap(matrix=mat, clip=clip * inv, alpha=False)
+            # pix.samples는 MuPDF 버퍼의 bytes 복사본 → 캐시가 소유권을 가짐
+            tiles.append((pix.x, pix.y, pix.samples, pix.width, pix.height, pix.stride))
+            del pix
+    return width, height, tuple(tiles)
+
+
+def _cached_entry(key: _RenderKey) -> _RenderEntry | None:
+    entry = _render_cache.get(key)
+    if entry is not None:
+        _render_cache.move_to_end(key)
+    return entry
+
+
+def _store_entry(key: _RenderKey, entry: _RenderEntry) -> None:
+    _render_cache[key] = entry
+    total = sum(_entry_bytes(e) for e in _render_cache.values())
+    while total > RENDER_CACHE_BYTES and len(_render_cache) > 1:
+        _, old = _render_cache.popitem(last=False)
+        total -= _entry_bytes(old)
+
+
+class _PrefetchSignals(QObject):
+    # (렌더링 키, 렌더링 결과) — 선읽기 스레드에서 발생, GUI 스레드에서 캐시에 저장
+    rendered = Signal(object, object)
+
+
+class _PrefetchJob(QRunnable):
+    """뷰어가 열어 둔 문서로 페이지 하나를 백그라운드에서 렌더링"""
+
+    def __init__(self, doc: fitz.Document, key: _RenderKey, signals: _PrefetchSignals):
+        super().__init__()
+        self.doc = doc
+        self.key = key
+        self.signals = signals
+
+    def run(self) -> None:
+        _, _, page_index, dpi = self.key
+        try:
+            with FITZ_LOCK:
+                # 다른 PDF를 불러오며 문서가 닫혔으면 건너뜀
+                if self.doc.is_closed:
+                    entry = None
+                else:
+                    entry = _render_tiles(self.doc[page_index], dpi)
+        except Exception:
+            # 선읽기 실패는 무시 (실제 표시할 때 다시 렌더링하며 오류 확인)
+            entry = None
+        self.signals.rendered.emit(self.key, entry)
+
+
+def clear_render_cache() -> None:
+    """렌더링 캐시 비우기 (메모리 확보용)"""
+    _render_cache.clear()
+
+
+# 화면 표시용 기본 렌더링 DPI (OCR 정확도와 무관, 메모리·렌더 시간 절감)
+DISPLAY_DPI = 150
+# 확대/축소 한 단계 배율
+ZOOM_IN = 1.2
+ZOOM_OUT = 1 / ZOOM_IN
+
+
 # ──────────────────────────────────────────────────
 # 1. ROIItem  (사각형 + 오차 점선 + 유형 편집)
 # ──────────────────────────────────────────────────
@@ -27,49 +129,54 @@ class ROIItem(QGraphicsRectItem):
         rect_local: QRectF,
         name: str,
         tolerance: int = 3,
-        field_type: str = "single"
+        field_type: str = "single",
+        display_scale: float = 1.0
     ):
         super().__init__(rect_local)
         self.name = name
         self.tolerance = tolerance
         self.field_type = field_type
+        # ROI 좌표(ROI_DPI 픽셀) → 화면 장면 좌표 배율 (오차 점선 표시용)
+        self.display_scale = display_scale
+        # 저장된 세트에서 불러온 경우 OCR 옵션을 보존
+        self.ocr_lang = ""
+        self.ocr_whitelist = ""
+        self.dpi = 0
 
         pen = QPen(QColor("magenta"), 1)
         self.setPen(pen)
         self.setBrush(Qt.transparent)
 
+        # 오차 점선은 paint()에서 그리므로 위치 변경 알림(itemChange)은 필요 없음
         self.setFlags(
             QGraphicsItem.ItemIsSelectable |
-            QGraphicsItem.ItemIsMovable |
-            QGraphicsItem.ItemSendsGeometryChanges
+            QGraphicsItem.ItemIsMovable
         )
 
-        dot_pen = QPen(QColor("magenta"))
-        dot_pen.setStyle(Qt.DotLine)
-        self._tol_rect = QGraphicsRectItem(self)
-        self._tol_rect.setPen(dot_pen)
-        self._update_tolerance()
-
-    def _update_tolerance(self):
-        base = self.rect()
-        t = self.tolerance
-        self._tol_rect.setRect(
-            QRectF(
-                base.left() - t,
-                base.top() - t,
-                base.width() + 2 * t,
-                base.height() + 2 * t,
-            )
-        )
+        # 오차 범위 점선은 paint()에서 직접 그림 (자식 아이템 없음)
+        self._dot_pen = QPen(QColor("magenta"))
+        self._dot_pen.setStyle(Qt.DotLine)
 
-    def itemChange(self, change, value):
-        if change in (
-            QGraphicsItem.ItemPositionChange,
-            QGraphicsItem.ItemScaleChange,
-            QGraphicsItem.ItemTransformChange,
-        ):
-            self._update_tolerance()
-        return super().itemChange(change, value)
+    def _tol_rect(self) -> QRectF:
+        t = self.tolerance * self.display_scale
+        return self.rect().adjusted(-t, -t, t, t)
+
+    def boundingRect(self) -> QRectF:
+        # 뷰가 AA 여백을 보정하지 않으므로(DontAdjustForAntialiasing) 1px 여유 포함
+        m = self.pen().widthF() / 2 + 1
+        return self._tol_rect().adjusted(-m, -m, m, m)
+
+    def paint(self, painter, option, widget=None):
+        # 뷰가 DontSavePainterState이므로 변경한 상태(펜·브러시·힌트)를 직접 복원
+        painter.save()
+        # 안티앨리어싱은 ROI 외곽선에만 적용 (페이지 타일은 픽셀 그대로 표시)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        super().paint(painter, option, widget)
+        if self.tolerance:
+            painter.setPen(self._dot_pen)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRect(self._tol_rect())
+        painter.restore()
 
     def contextMenuEvent(self, e: QContextMenuEvent):
         menu = QMenu()
@@ -80,14 +187,22 @@ class ROIItem(QGraphicsRectItem):
         menu.addActions([act_rename, act_tol, act_type, act_del])
 
         sel = menu.exec(e.screenPos())
+        views = self.scene().views()
+        roi_items = views[0].roi_items if views else {}
         if sel is act_del:
+            roi_items.pop(self.name, None)
             self.scene().removeItem(self)
         elif sel is act_rename:
             new, ok = QInputDialog.getText(
                 None, "ROI 이름", "새 이름:", text=self.name
             )
-            if ok and new.strip():
-                self.name = new.strip()
+            if ok and new.strip() and new.strip() != self.name:
+                new = new.strip()
+                if new in roi_items:
+                    new += "_new"
+                roi_items.pop(self.name, None)
+                roi_items[new] = self
+                self.name = new
         elif sel is act_tol:
             val, ok = QInputDialog.getInt(
                 None,
@@ -98,8 +213,9 @@ class ROIItem(QGraphicsRectItem):
                 50
             )
             if ok:
+                self.prepareGeometryChange()
                 self.tolerance = val
-                self._update_tolerance()
+                self.update()
         elif sel is act_type:
             items = ["단일 필드", "표 형식"]
             current = 0 if self.field_type == "single" else 1
@@ -126,33 +242,148 @@ class PDFViewer(QGraphicsView):
         self._origin: Optional[QPoint] = None
 
         self.roi_items: Dict[str, ROIItem] = {}
+        # 현재 PDF · 페이지 상태와 표시 중인 페이지 타일 아이템
+        self.pdf_path: Optional[Path] = None
+        self.page_count = 0
+        # 열어 둔 문서 (표시·선읽기가 공유) 와 렌더링 키 앞부분 (절대 경로, 수정 시각)
+        self._doc: Optional[fitz.Document] = None
+        self._doc_key: Tuple[str, int] = ("", 0)
+        self.page_index = 0
+        self._tiles: List[QGraphicsPixmapItem] = []
+        # 기본 ROI 이름(ROI_n) 다음 후보 번호
+        self._next_roi_idx = 1
         self.scale_factor = 1.0
-        self.dpi = 600  # 기본 DPI 설정 (ROI 지정과 OCR 모두 일치)
+        # 화면 표시용 렌더링 DPI (ROI 좌표는 항상 ROI_DPI 기준으로 저장)
+        self.display_dpi = DISPLAY_DPI
+        # 장면 좌표 → ROI 좌표 배율
+        self.roi_scale = ROI_DPI / self.display_dpi
 
-        # 안티앨리어싱 활성화
-        self.setRenderHint(QPainter.Antialiasing, True)
+        # 인접 페이지 선읽기: 전용 스레드 1개에서 렌더링 후 시그널로 GUI 스레드에 전달
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(1)
+        self._prefetch_signals = _PrefetchSignals(self)
+        self._prefetch_signals.rendered.connect(self._on_prefetched)
+        self._prefetching: set[_RenderKey] = set()
+        QApplication.instance().aboutToQuit.connect(self._stop_prefetch)
 
-    def load_pdf(self, path: str | Path):
+        # 연속 확대/축소 입력을 모아 마지막 배율로 한 번만 변환 적용
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(40)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
+        # 현재 뷰에 적용된 배율
+        self._applied_scale = 1.0
+
+        # 페이지 타일은 안티앨리어싱·부드러운 변환 없이 표시 (ROIItem.paint에서만 AA)
+        self.setRenderHint(QPainter.Antialiasing, False)
+        self.setRenderHint(QPainter.SmoothPixmapTransform, False)
+        # 변경된 영역만 다시 그리고, 아이템마다 painter 상태 저장/복원·AA 여백 보정 생략
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setOptimizationFlags(
+            QGraphicsView.DontSavePainterState |
+            QGraphicsView.DontAdjustForAntialiasing
+        )
+        # 확대/축소는 마우스 위치 기준
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+
+    def load_pdf(self, path: str | Path, page_index: int = 0):
         """
-        PDF 파일을 지정된 DPI로 렌더링하고 뷰어에 표시합니다.
-        ROI 지정과 OCR 추출 모두 동일한 DPI를 사용하기 위함입니다.
+        PDF 파일을 화면 표시용 DPI(display_dpi)로 타일 단위 렌더링하여 표시합니다.
+        ROI 좌표는 저장 시 roi_scale을 곱해 ROI_DPI 기준으로 환산합니다.
+        같은 페이지(수정 시각 동일)를 다시 열면 캐시된 렌더링 결과를 사용합니다.
         """
-        doc = fitz.open(str(path))
-        zoom = self.dpi / 72
-        pix  = doc[0].get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
-        img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
-        pm  = QPixmap.fromImage(img)
-        doc.close()
-
-        # 장면 초기화 및 이미지 추가
+        self._close_document()
+        self.pdf_path = Path(path)
+        resolved = self.pdf_path.resolve()
+        with FITZ_LOCK:
+            self._doc = fitz.open(str(resolved))
+            self.page_count = self._doc.page_count
+        self._doc_key = (str(resolved), resolved.stat().st_mtime_ns)
+
+        # 장면 초기화
         self.scene().clear()
+        self._tiles = []
         self.roi_items.clear()
-        self.scene().addPixmap(pm)
-        self.setSceneRect(pm.rect())
+        self._next_roi_idx = 1
+        self.show_page(page_index)
 
         # 변환 및 확대/축소 비율 초기화
+        self._zoom_timer.stop()
         self.resetTransform()
         self.scale_factor = 1.0
+        self._applied_scale = 1.0
+
+    def show_page(self, page_index: int) -> None:
+        """현재 PDF의 다른 페이지를 표시합니다. (ROI는 그대로 유지)"""
+        if self.pdf_path is None:
+            return
+        page_index = max(0, min(page_index, self.page_count - 1))
+        key = self._render_key(page_index)
+        entry = _cached_entry(key)
+        if entry is None:
+            # 선읽기 중인 페이지면 FITZ_LOCK에서 잠시 기다린 뒤 렌더링
+            with FITZ_LOCK:
+                entry = _render_tiles(self._doc[page_index], self.display_dpi)
+            _store_entry(key, entry)
+        width, height, tiles = entry
+
+        # 이전 페이지 타일 제거 후 타일 이미지 추가 (타일 원점에 배치)
+        for tile in self._tiles:
+            self.scene().removeItem(tile)
+        self._tiles = []
+        for x, y, samples, w, h, stride in tiles:
+            # QImage는 캐시의 bytes를 참조만 하고(복사 없음), fromImage에서
+            # 픽스맵으로 한 번만 변환됩니다. bytes는 캐시가 계속 보유합니다.
+            img = QImage(samples, w, h, stride, QImage.Format_RGB888)
+            tile = self.scene().addPixmap(QPixmap.fromImage(img))
+            tile.setOffset(x, y)
+            # ROI 아래에 표시
+            tile.setZValue(-1)
+            # 화면 배율 그대로의 래스터를 보관 → 이동(스크롤) 시 재변환 없음
+            tile.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+            self._tiles.append(tile)
+            del img
+        self.setSceneRect(QRectF(0, 0, width, height))
+        self.page_index = page_index
+        self._prefetch(page_index)
+
+    def _render_key(self, page_index: int) -> _RenderKey:
+        return (*self._doc_key, page_index, self.display_dpi)
+
+    def _prefetch(self, page_index: int) -> None:
+        # 앞뒤 페이지를 백그라운드에서 미리 렌더링 (페이지 이동 시 대기 제거)
+        # 아직 시작하지 않은 이전 선읽기는 취소
+        self._prefetch_pool.clear()
+        self._prefetching.clear()
+        for n in (page_index + 1, page_index - 1):
+            if not 0 <= n < self.page_count:
+                continue
+            key = self._render_key(n)
+            if key in _render_cache or key in self._prefetching:
+                continue
+            self._prefetching.add(key)
+            self._prefetch_pool.start(_PrefetchJob(self._doc, key, self._prefetch_signals))
+
+    def _on_prefetched(self, key: _RenderKey, entry: _RenderEntry | None) -> None:
+        self._prefetching.discard(key)
+        if entry is not None and key not in _render_cache:
+            _store_entry(key, entry)
+
+    def _stop_prefetch(self) -> None:
+        # 대기 중인 선읽기 취소, 실행 중인 렌더링이 끝날 때까지 대기
+        self._prefetch_pool.clear()
+        self._prefetch_pool.waitForDone()
+
+    def _close_document(self) -> None:
+        # 실행 중인 선읽기는 FITZ_LOCK에서 끝나기를 기다린 뒤 닫음 (이후 작업은 닫힌 문서를 건너뜀)
+        self._prefetch_pool.clear()
+        self._prefetching.clear()
+        if self._doc is not None:
+            with FITZ_LOCK:
+                self._doc.close()
+                # 문서를 닫은 뒤 MuPDF 내부 저장소(폰트·이미지 캐시) 반환
+                fitz.TOOLS.store_shrink(100)
+            self._doc = None
 
     def mousePressEvent(self, e: QMouseEvent):
         if e.button() == Qt.LeftButton:
@@ -177,9 +408,10 @@ class PDFViewer(QGraphicsView):
                 width  = br_scene.x() - tl_scene.x()
                 height = br_scene.y() - tl_scene.y()
 
-                idx = 1
+                idx = self._next_roi_idx
                 while f"ROI_{idx}" in self.roi_items:
                     idx += 1
+                self._next_roi_idx = idx + 1
                 default_name = f"ROI_{idx}"
 
                 dlg = ROIDialog(default_name, self)
@@ -193,7 +425,7 @@ class PDFViewer(QGraphicsView):
                     name += "_new"
 
                 rect_local = QRectF(0, 0, width, height)
-                item = ROIItem(rect_local, name, tol, ftype)
+                item = ROIItem(rect_local, name, tol, ftype, 1 / self.roi_scale)
                 item.setPos(tl_scene)
                 self.scene().addItem(item)
                 self.roi_items[name] = item
@@ -203,10 +435,7 @@ class PDFViewer(QGraphicsView):
 
     def wheelEvent(self, e: QWheelEvent):
         if e.modifiers() & Qt.ControlModifier:
-            self.scale_factor *= 1.2 if e.angleDelta().y() > 0 else 1 / 1.2
-            t = QTransform()
-            t.scale(self.scale_factor, self.scale_factor)
-            self.setTransform(t)
+            self._zoom_by(ZOOM_IN if e.angleDelta().y() > 0 else ZOOM_OUT)
         else:
             super().wheelEvent(e)
 
@@ -214,15 +443,28 @@ class PDFViewer(QGraphicsView):
         if e.modifiers() & Qt.ControlModifier and e.key() in (
             Qt.Key_Plus, Qt.Key_Equal, Qt.Key_Minus
         ):
-            self.scale_factor *= 1.2 if e.key() in (
-                Qt.Key_Plus, Qt.Key_Equal
-            ) else 1 / 1.2
-            t = QTransform()
-            t.scale(self.scale_factor, self.scale_factor)
-            self.setTransform(t)
+            self._zoom_by(ZOOM_IN if e.key() in (Qt.Key_Plus, Qt.Key_Equal) else ZOOM_OUT)
         else:
             super().keyPressEvent(e)
 
+    def _zoom_by(self, step: float) -> None:
+        # 배율만 누적하고 실제 변환은 타이머 만료 시 한 번 적용
+        self.scale_factor *= step
+        self._zoom_timer.start()
+
+    def _apply_zoom(self) -> None:
+        """누적된 scale_factor를 한 번에 적용 (배율은 0.01 단위로 맞춤)"""
+        self._set_zoom(round(self.scale_factor * 100) / 100)
+
+    def _set_zoom(self, scale: float) -> None:
+        # 적용된 배율과 같으면 변환을 다시 만들지 않음
+        if scale == self._applied_scale:
+            return
+        t = QTransform()
+        t.scale(scale, scale)
+        self.setTransform(t)
+        self._applied_scale = scale
+
     def export_rois(self) -> Dict[str, ROIItem]:
         """현재 지정된 ROI 항목을 사전 형태로 반환합니다."""
         return self.roi_items
@@ -232,3 +474,20 @@ class PDFViewer(QGraphicsView):
         for item in list(self.roi_items.values()):
             self.scene().removeItem(item)
         self.roi_items.clear()
+        self._next_roi_idx = 1
+
+    def show_rois(self, rois: Iterable[ROI]) -> None:
+        """저장된 ROI(ROI_DPI 좌표)를 화면 장면 좌표로 환산하여 표시합니다."""
+        self.clear_rois()
+        k = 1 / self.roi_scale
+        for roi in rois:
+            item = ROIItem(
+                QRectF(0, 0, roi.w * k, roi.h * k),
+                roi.name, roi.tolerance, roi.field_type, k
+            )
+            item.ocr_lang = roi.ocr_lang
+            item.ocr_whitelist = roi.ocr_whitelist
+            item.dpi = roi.dpi
+            item.setPos(roi.x * k, roi.y * k)
+            self.scene().addItem(item)
+            self.roi_items[roi.name] = item
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import logging
+
+import numpy as np
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QComboBox, QPushButton,
+    QLabel, QComboBox, QPushButton, QSpinBox,
     QInputDialog, QFileDialog
 )
 
@@ -13,6 +16,8 @@ from ui.pdf_viewer import PDFViewer
 from core.roi_manager import ROIManager
 from core.models import ROI, ROISet
 
+logger = logging.getLogger(__name__)
+
 
 class TabCoordinate(QWidget):
     """
@@ -34,16 +39,22 @@ class TabCoordinate(QWidget):
         # 위젯 생성
         self.btn_load_pdf   = QPushButton("PDF 불러오기")
         self.viewer         = PDFViewer(self)
+        self.spn_page       = QSpinBox()
         self.cmb_set        = QComboBox()
         self.btn_delete_set = QPushButton("삭제")
         self.btn_save_set   = QPushButton("저장")
 
-        # 좌표 세트 드롭다운 초기화
-        self._refresh_set_list()
+        # 페이지 선택 (PDF를 불러오기 전에는 비활성)
+        self.spn_page.setRange(1, 1)
+        self.spn_page.setEnabled(False)
+
+        # 좌표 세트 드롭다운은 ROIManager 로드가 끝나면 채움 (MainWindow.data_loaded)
 
         # 레이아웃 설정
         control_layout = QHBoxLayout()
         control_layout.addWidget(self.btn_load_pdf)
+        control_layout.addWidget(QLabel("페이지:"))
+        control_layout.addWidget(self.spn_page)
         control_layout.addWidget(QLabel("좌표 세트:"))
         control_layout.addWidget(self.cmb_set)
         control_layout.addWidget(self.btn_delete_set)
@@ -56,10 +67,15 @@ class TabCoordinate(QWidget):
 
         # 시그널 연결
         self.btn_load_pdf.clicked.connect(self.on_load_pdf)
+        self.spn_page.valueChanged.connect(self.on_page_changed)
         self.cmb_set.currentTextChanged.connect(self.on_set_changed)
         self.btn_delete_set.clicked.connect(self.on_delete_set)
         self.btn_save_set.clicked.connect(self.on_save_set)
 
+    def refresh_sets(self) -> None:
+        """외부(ROI 세트 로드 완료 등)에서 세트 목록 갱신 시 호출"""
+        self._refresh_set_list()
+
     def _refresh_set_list(self) -> None:
         """ROIManager의 세트 리스트로 콤보박스 업데이트"""
         self.cmb_set.blockSignals(True)
@@ -78,12 +94,26 @@ class TabCoordinate(QWidget):
         )
         if path:
             self.viewer.load_pdf(path)
+            self.spn_page.blockSignals(True)
+            self.spn_page.setRange(1, max(self.viewer.page_count, 1))
+            self.spn_page.setValue(1)
+            self.spn_page.setEnabled(True)
+            self.spn_page.blockSignals(False)
+            # 선택된 세트가 있으면 새 PDF 위에 다시 표시
+            roi_set = self.roi_mgr.get_set(self.cmb_set.currentText())
+            if roi_set:
+                self.viewer.show_rois(roi_set.rois)
+
+    def on_page_changed(self, page: int) -> None:
+        """페이지 변경 시 호출: 지정한 ROI는 유지하고 페이지 이미지만 교체"""
+        self.viewer.show_page(page - 1)
 
     def on_set_changed(self, name: str) -> None:
         """세트 변경 시 호출: PDFViewer에 로드"""
         if name:
-            self.roi_mgr.load_set(name)
-            self.viewer.refresh()
+            roi_set = self.roi_mgr.get_set(name)
+            if roi_set:
+                self.viewer.show_rois(roi_set.rois)
             self.set_changed.emit(name)
             self.sets_updated.emit()
 
@@ -106,25 +136,32 @@ class TabCoordinate(QWidget):
         if not (ok and name):
             return
 
-        # 로더에서 ROIItem 가져오기 (item.sceneBoundingRect 사용)
+        # 로더에서 ROIItem 가져오기
+        items = list(self.viewer.export_rois().values())
+        scene_rects = np.empty((len(items), 4), dtype=np.float64)
+        for i, item in enumerate(items):
+            # 펜 두께가 포함되지 않은 사각형 자체의 장면 좌표 (배율 환산 시 오차 누적 방지)
+            rect = item.mapRectToScene(item.rect())
+            scene_rects[i] = (rect.x(), rect.y(), rect.width(), rect.height())
+        # 장면 좌표(display_dpi) → ROI_DPI 좌표: 한 번의 배열 연산으로 환산
+        coords = np.rint(scene_rects * self.viewer.roi_scale).astype(np.int32)
+
         rois: list[ROI] = []
-        items = self.viewer.export_rois().values()
-        for item in items:
-            # sceneBoundingRect로 정확한 위치/크기 취득
-            rect = item.sceneBoundingRect()
-            x = int(rect.x())
-            y = int(rect.y())
-            w = int(rect.width())
-            h = int(rect.height())
-            # 로그로 확인
-            print(f"[TabCoordinate] Saving ROI '{item.name}' → x={x}, y={y}, w={w}, h={h}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for item, (x, y, w, h) in zip(items, coords.tolist()):
+            # 로그로 확인 (DEBUG 수준일 때만)
+            if debug:
+                logger.debug("Saving ROI '%s' → x=%d, y=%d, w=%d, h=%d", item.name, x, y, w, h)
             rois.append(
                 ROI(
                     name=item.name,
                     x=x, y=y,
                     w=w, h=h,
                     tolerance=item.tolerance,
-                    field_type=item.field_type
+                    field_type=item.field_type,
+                    ocr_lang=item.ocr_lang,
+                    ocr_whitelist=item.ocr_whitelist,
+                    dpi=item.dpi
                 )
             )
 
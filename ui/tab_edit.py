@@ -17,14 +17,14 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
-from core.models import ROI, ROISet
+from core.models import ROI, ROI_DPI_RANGE, ROISet
 from core.roi_manager import ROIManager
 
 
 class TabEdit(QWidget):
     """좌표 세트 편집 탭"""
 
-    HEADERS = ["이름", "X", "Y", "W", "H", "오차", "유형"]
+    HEADERS = ["이름", "X", "Y", "W", "H", "오차", "유형", "언어", "허용 문자", "DPI"]
 
     def __init__(self, mgr: ROIManager):
         super().__init__()
@@ -51,8 +51,7 @@ class TabEdit(QWidget):
         self.table.setColumnCount(len(self.HEADERS))
         self.table.setHorizontalHeaderLabels(self.HEADERS)
 
-        # 초기화
-        self.refresh_sets()
+        # 세트 목록은 ROIManager 로드가 끝나면 채움 (MainWindow.data_loaded → refresh_sets)
 
         # 시그널
         self.cmb_sets.currentTextChanged.connect(self.populate_table)
@@ -82,13 +81,25 @@ class TabEdit(QWidget):
             self.table.setRowCount(0)
             return
 
-        self.table.setRowCount(len(rs.rois))
-        for row, r in enumerate(rs.rois):
-            values = [r.name, r.x, r.y, r.w, r.h, r.tolerance, r.field_type]
-            for col, val in enumerate(values):
-                item = QTableWidgetItem(str(val))
-                item.setFlags(item.flags() | Qt.ItemIsEditable)  # 모든 셀 편집 허용
-                self.table.setItem(row, col, item)
+        table = self.table
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable  # 모든 셀 편집 허용
+        sorting = table.isSortingEnabled()
+
+        # 일괄 채우는 동안 재배치·재그리기 중지
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        try:
+            table.setRowCount(len(rs.rois))
+            for row, r in enumerate(rs.rois):
+                values = [r.name, r.x, r.y, r.w, r.h, r.tolerance, r.field_type,
+                          r.ocr_lang, r.ocr_whitelist, r.dpi]
+                for col, val in enumerate(values):
+                    item = QTableWidgetItem(str(val))
+                    item.setFlags(flags)
+                    table.setItem(row, col, item)
+        finally:
+            table.setSortingEnabled(sorting)
+            table.setUpdatesEnabled(True)
 
     # ───────────────────────────────
     # 3. 변경 적용
@@ -98,24 +109,34 @@ class TabEdit(QWidget):
         if not set_name:
             return
 
-        # 이름 중복 검사
-        names = [self.table.item(r, 0).text().strip()
-                 for r in range(self.table.rowCount())]
-        if len(names) != len(set(names)):
-            QMessageBox.warning(self, "중복 이름", "ROI 이름이 중복되었습니다.")
-            return
-
+        # 한 번의 순회로 이름 중복 검사 + ROI 변환
+        item = self.table.item
+        seen: set[str] = set()
         rois: List[ROI] = []
         for row in range(self.table.rowCount()):
             try:
-                name = self.table.item(row, 0).text().strip()
-                x    = int(self.table.item(row, 1).text())
-                y    = int(self.table.item(row, 2).text())
-                w    = int(self.table.item(row, 3).text())
-                h    = int(self.table.item(row, 4).text())
-                tol  = int(self.table.item(row, 5).text())
-                ftyp = self.table.item(row, 6).text().strip()
-                rois.append(ROI(name, x, y, w, h, tol, ftyp))
+                name = item(row, 0).text().strip()
+                if name in seen:
+                    QMessageBox.warning(self, "중복 이름", "ROI 이름이 중복되었습니다.")
+                    return
+                seen.add(name)
+                x    = int(item(row, 1).text())
+                y    = int(item(row, 2).text())
+                w    = int(item(row, 3).text())
+                h    = int(item(row, 4).text())
+                tol  = int(item(row, 5).text())
+                ftyp = item(row, 6).text().strip()
+                lang = item(row, 7).text().strip()
+                wl   = item(row, 8).text().strip()
+                dpi  = int(item(row, 9).text().strip() or 0)
+                if dpi and not ROI_DPI_RANGE[0] <= dpi <= ROI_DPI_RANGE[1]:
+                    QMessageBox.warning(
+                        self, "입력 오류",
+                        f"{row+1}행 DPI는 0(기본값) 또는 "
+                        f"{ROI_DPI_RANGE[0]}~{ROI_DPI_RANGE[1]} 사이여야 합니다."
+                    )
+                    return
+                rois.append(ROI(name, x, y, w, h, tol, ftyp, lang, wl, dpi))
             except Exception:
                 QMessageBox.warning(self, "입력 오류",
                                     f"{row+1}행 자료가 올바르지 않습니다.")
@@ -19,11 +19,25 @@ from PySide6.QtCore import Qt
 
 from core.exclusion_manager import ExclusionManager
 
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # 미설치 시 openpyxl(.xlsx/.xlsm) · xlrd(.xls) 사용
+    CalamineWorkbook = None
+
+
+def _cell_value(v: object) -> object:
+    # calamine·xlrd는 숫자 셀을 모두 float로 돌려주므로 정수 값은 int로 (123.0 → "123")
+    if isinstance(v, float) and v.is_integer():
+        return int(v)
+    return v
+
 
 class TabExclusion(QWidget):
     def __init__(self, mgr: ExclusionManager):
         super().__init__()
         self.mgr = mgr
+        # 마지막으로 읽은 엑셀 ((경로, 수정 시각, 크기), A열 값) — 같은 파일을 다시 고르면 재사용
+        self._last_excel: tuple[tuple[str, int, int], List[object]] | None = None
 
         # ─ 입력 UI ─
         self.edt_text = QLineEdit()
@@ -51,16 +65,30 @@ class TabExclusion(QWidget):
         self.btn_del.clicked.connect(self.delete_selected)
         self.btn_load.clicked.connect(self.load_excel)
 
-        self.populate_table()
+        # 목록은 ExclusionManager 로드가 끝나면 채움 (MainWindow.data_loaded → populate_table)
 
     # ───────────────────────────
     def populate_table(self):
         items = self.mgr.list_all()
-        self.table.setRowCount(len(items))
-        for row, txt in enumerate(items):
-            item = QTableWidgetItem(txt)
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row, 0, item)
+        table = self.table
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled  # 편집 불가
+        sorting = table.isSortingEnabled()
+
+        # 일괄 채우는 동안 재배치·재그리기·시그널 중지 (N회 → 1회)
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(items))
+            for row, txt in enumerate(items):
+                item = QTableWidgetItem(txt)
+                item.setFlags(flags)
+                table.setItem(row, 0, item)
+        finally:
+            table.blockSignals(False)
+            table.setSortingEnabled(sorting)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
 
     # ───────────────────────────
     def add_text(self):
@@ -88,11 +116,57 @@ class TabExclusion(QWidget):
         if not path:
             return
         try:
-            import pandas as pd
-            df = pd.read_excel(Path(path), header=None, usecols=[0])
-            texts = df.iloc[:, 0].dropna().astype(str).tolist()
+            existing = set(self.mgr.list_all())
+            # 파일 내 중복·기존 항목 제거 (입력 순서 유지)
+            texts = list(dict.fromkeys(
+                t for t in (str(v).strip() for v in self._cached_column_a(Path(path)))
+                if t and t not in existing
+            ))
             self.mgr.add_many(texts)
             QMessageBox.information(self, "완료", f"{len(texts)}개 텍스트를 추가했습니다.")
             self.populate_table()
         except Exception as e:
             QMessageBox.critical(self, "오류", f"엑셀 읽기 실패:\n{e}")
+
+    def _cached_column_a(self, path: Path) -> List[object]:
+        """_read_column_a 결과를 (경로, 수정 시각, 크기) 기준으로 재사용"""
+        # 수정 시각 해상도가 낮은 파일 시스템에서도 덮어쓴 파일을 알아보도록 크기도 비교
+        st = path.stat()
+        key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+        if self._last_excel is None or self._last_excel[0] != key:
+            self._last_excel = (key, self._read_column_a(path))
+        return self._last_excel[1]
+
+    @staticmethod
+    def _read_column_a(path: Path) -> List[object]:
+        """엑셀 A열 값 목록 (빈 셀 제외)"""
+        if CalamineWorkbook is not None:
+            # Rust 기반 파서: 모든 형식(.xls 포함)을 셀 객체 없이 바로 읽음
+            sheet = CalamineWorkbook.from_path(str(path)).get_sheet_by_index(0)
+            return [
+                _cell_value(row[0]) for row in sheet.to_python()
+                if row and row[0] not in (None, "")
+            ]
+
+        if path.suffix.lower() == ".xls":
+            # 구형 .xls는 openpyxl이 지원하지 않으므로 xlrd로 첫 시트만 읽음
+            # (pandas 전체를 불러오지 않음, pandas도 .xls는 내부적으로 xlrd 사용)
+            import xlrd
+            book = xlrd.open_workbook(str(path), on_demand=True)
+            try:
+                sheet = book.sheet_by_index(0)
+                return [_cell_value(v) for v in sheet.col_values(0) if v not in (None, "")]
+            finally:
+                book.release_resources()
+
+        from openpyxl import load_workbook
+        wb = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+        try:
+            # 다른 형식과 같이 첫 번째 시트를 읽음 (활성 시트는 저장 당시 선택된 시트)
+            ws = wb.worksheets[0]
+            return [
+                v for (v,) in ws.iter_rows(min_col=1, max_col=1, values_only=True)
+                if v is not None
+            ]
+        finally:
+            wb.close()
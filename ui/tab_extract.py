@@ -3,33 +3,200 @@
 # ROI에 매핑된 영역의 텍스트를 추출하고 엑셀로 저장하는 기능을 제공합니다.
 
 from __future__ import annotations
+import queue
+import threading
 from pathlib import Path
+from typing import Callable
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QFileDialog, QMessageBox, QTableWidget, QTableWidgetItem, QComboBox
+    QFileDialog, QMessageBox, QTableWidget, QTableWidgetItem, QComboBox,
+    QProgressBar, QApplication
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThread, Signal
 
-from core.excel_writer import ExcelWriter
+from core.excel_writer import ExcelWriter, column_index
 from core.models import ROI, ROISet
-from openpyxl.utils.cell import column_index_from_string
+from core.ocr_cache import OCRCache
 from core.ocr_engine import OCREngine
 
+# OCR 단계와 엑셀 기록 단계 사이에 대기할 수 있는 PDF 결과 수
+PIPELINE_DEPTH = 2
+
+
+class ExtractWorker(QThread):
+    """
+    OCR 추출 + 엑셀 저장을 UI 스레드 밖에서 수행하는 작업 스레드
+    (페이지 OCR 자체는 OCREngine의 프로세스 풀에서 병렬 처리)
+    """
+
+    progress = Signal(int, int)   # 처리한 페이지 수, 전체 페이지 수
+    done = Signal(str)            # 저장된 엑셀 경로
+    failed = Signal(str)          # 오류 메시지
+
+    def __init__(
+        self,
+        ocr: OCREngine,
+        pdf_paths: list[Path],
+        page_counts: list[int],
+        rois: list[ROI],
+        rects,
+        mapping: dict[str, int],
+        excel_path: Path,
+        excluded: Callable[[str], bool] | None = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.ocr = ocr
+        self.pdf_paths = pdf_paths
+        # 페이지 수는 GUI 스레드에서 미리 셈 (이 스레드에서는 fitz를 호출하지 않음)
+        self.page_counts = page_counts
+        self.rois = rois
+        self.rects = rects
+        self.mapping = mapping
+        self.excel_path = excel_path
+        # 제외 문자열이 포함된 인식 결과는 빈 값으로 기록
+        self.excluded = excluded
+        # 창 종료 등으로 중단 요청 시 설정 (PDF 단위로 확인)
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """작업 중단 요청 (진행 중인 페이지 묶음이 끝나면 멈추고 엑셀은 저장하지 않음)"""
+        self._cancel.set()
+
+    def run(self) -> None:
+        try:
+            self._extract()
+        except Exception as e:
+            if not self._cancel.is_set():
+                self.failed.emit(str(e))
+        else:
+            self.done.emit(str(self.excel_path))
+
+    def _extract(self) -> None:
+        writer = ExcelWriter(self.excel_path, sheet_name="Sheet1")
+        saved = False
+        try:
+            self._run_pipeline(writer)
+            writer.save()
+            saved = True
+        finally:
+            if not saved:
+                # 실패 시 기록 중이던 임시 파일을 닫고 삭제 (기존 엑셀은 그대로)
+                writer.abort()
+
+    def _run_pipeline(self, writer: ExcelWriter) -> None:
+        page_counts = self.page_counts
+        total = sum(page_counts)
+        self.progress.emit(0, total)
+
+        # OCR 단계(이 스레드, 워커 프로세스 사용) → 기록 단계(별도 스레드)를
+        # 크기 제한 큐로 연결: 다음 PDF 인식 중에 이전 PDF의 행을 배치
+        # 모든 PDF의 페이지를 한 풀에 함께 제출하고 결과는 입력 순서대로 받음
+        results_q: queue.Queue = queue.Queue(maxsize=PIPELINE_DEPTH)
+        errors: list[Exception] = []
+        write_thread = threading.Thread(
+            target=self._write_stage, args=(results_q, writer, total, errors), daemon=True
+        )
+        write_thread.start()
+        results_iter = self.ocr.extract_pdfs_parallel(
+            list(zip(self.pdf_paths, page_counts)), self.rois, self.rects
+        )
+        try:
+            for page_count, results in zip(page_counts, results_iter):
+                if self._cancel.is_set():
+                    raise RuntimeError("작업이 중단되었습니다.")
+                if errors or not self._put(results_q, (page_count, results), write_thread):
+                    break
+        finally:
+            # OCR 단계가 실패해도 종료 신호를 보내고 기록 단계가 끝날 때까지 대기
+            try:
+                results_iter.close()
+            finally:
+                self._put(results_q, None, write_thread)
+                write_thread.join()
+        if errors:
+            raise errors[0]
+
+    @staticmethod
+    def _put(results_q: queue.Queue, item, write_thread: threading.Thread) -> bool:
+        # 큐가 가득 차 있어도 기록 스레드가 끝났으면 기다리지 않음 (영구 대기 방지)
+        while write_thread.is_alive():
+            try:
+                results_q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _write_stage(
+        self,
+        results_q: queue.Queue,
+        writer: ExcelWriter,
+        total: int,
+        errors: list[Exception],
+    ) -> None:
+        mapping = self.mapping
+        excluded = self.excluded
+        processed = 0
+        row_counter = 1
+        while True:
+            item = results_q.get()
+            if item is None:
+                return
+            if errors:
+                # 오류 이후에는 OCR 단계가 막히지 않도록 큐만 비움
+                continue
+            page_count, results = item
+            try:
+                for page_num in range(page_count):
+                    texts, tables = results[page_num]
+                    # 단일 필드 (첫 행에만): 열 번호 → 값 으로 한 행을 모아 한 번에 기록
+                    if excluded is None:
+                        row = {mapping[name]: text for name, text in texts.items()}
+                    else:
+                        row = {
+                            mapping[name]: "" if text and excluded(text) else text
+                            for name, text in texts.items()
+                        }
+                    writer.write_row(row_counter, row)
+                    # 표 형식: 테이블 각 행을 해당 열부터 행 단위로 배치
+                    max_rows = 0
+                    for name, table in tables.items():
+                        if excluded is not None:
+                            table = [
+                                ["" if excluded(cell) else cell for cell in row]
+                                for row in table
+                            ]
+                        writer.write_table(row_counter, mapping[name], table)
+                        max_rows = max(max_rows, len(table))
+                    # 다음 페이지 위치 이동
+                    row_counter += max(max_rows, 1)
+                # 이 PDF까지의 행은 확정 → 워크북으로 내보내 버퍼 비우기
+                writer.flush_until(row_counter)
+                processed += page_count
+                self.progress.emit(processed, total)
+            except Exception as e:
+                # 기록 스레드는 종료 신호를 받을 때까지 살아 있어야 OCR 단계가 막히지 않음
+                errors.append(e)
+
 
 class TabExtract(QWidget):
     def __init__(self, roi_mgr: ROIManager, ex_mgr: ExclusionManager):
         super().__init__()
         self.roi_mgr = roi_mgr
         self.ex_mgr = ex_mgr
-        self.ocr = OCREngine()
+        # 이전 실행의 인식 결과를 재사용 (매핑 열만 추가한 재실행 등)
+        self.ocr = OCREngine(cache=OCRCache())
+        # 프로그램 종료 시 워커 프로세스 풀·열린 PDF·Tesseract API 정리
+        QApplication.instance().aboutToQuit.connect(self.ocr.shutdown)
         self.pdf_paths: list[Path] = []
+        self._worker: ExtractWorker | None = None
 
         self._init_ui()
         # ROI 세트가 변경되면 매핑 테이블 갱신
         self.set_selector.currentIndexChanged.connect(self._populate_mapping)
-        # 초기 매핑
-        self._populate_mapping()
+        # 세트 목록·초기 매핑은 ROIManager 로드가 끝나면 채움 (MainWindow.data_loaded → refresh_sets)
 
     def _init_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -38,7 +205,6 @@ class TabExtract(QWidget):
         h1 = QHBoxLayout()
         h1.addWidget(QLabel("ROI 세트:"), alignment=Qt.AlignVCenter)
         self.set_selector = QComboBox()
-        self.set_selector.addItems(self.roi_mgr.list_sets())
         h1.addWidget(self.set_selector)
         layout.addLayout(h1)
 
@@ -57,10 +223,19 @@ class TabExtract(QWidget):
         self.map_table.setHorizontalHeaderLabels(["ROI 이름", "열 지정 (예: A, B, C)"])
         layout.addWidget(self.map_table)
 
-        # 추출 실행 버튼
-        btn_run = QPushButton("추출 시작")
-        btn_run.clicked.connect(self.on_run)
-        layout.addWidget(btn_run, alignment=Qt.AlignRight)
+        # 진행률 + 추출 실행 버튼
+        h3 = QHBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFormat("%v / %m 페이지")
+        self.progress_bar.hide()
+        self.btn_clear_cache = QPushButton("OCR 캐시 비우기")
+        self.btn_clear_cache.clicked.connect(self.on_clear_cache)
+        self.btn_run = QPushButton("추출 시작")
+        self.btn_run.clicked.connect(self.on_run)
+        h3.addWidget(self.progress_bar, 1)
+        h3.addWidget(self.btn_clear_cache)
+        h3.addWidget(self.btn_run, alignment=Qt.AlignRight)
+        layout.addLayout(h3)
 
     def on_select_pdf(self) -> None:
         paths, _ = QFileDialog.getOpenFileNames(
@@ -70,6 +245,13 @@ class TabExtract(QWidget):
             self.pdf_paths = [Path(p) for p in paths]
             self.pdf_label.setText(f"선택된 PDF: {len(paths)}개")
 
+    def on_clear_cache(self) -> None:
+        """저장된 OCR 결과 캐시 삭제"""
+        self.ocr.cache.clear()
+        # 병렬 인식 결과는 워커 프로세스의 캐시에 있으므로 워커 캐시도 함께 비움
+        self.ocr.clear_all_crop_caches()
+        QMessageBox.information(self, "완료", "OCR 캐시를 비웠습니다.")
+
     def on_run(self) -> None:
         """OCR 실행 후 엑셀에 결과 저장"""
         if not self.pdf_paths:
@@ -89,84 +271,97 @@ class TabExtract(QWidget):
             save_path += '.xlsx'
         excel_path = Path(save_path)
 
-        # 새 워크북 생성
-        writer = ExcelWriter(excel_path, sheet_name="Sheet1")
-
         # 셀 매핑 정보 수집 (열 지정만)
         mapping: dict[str, int] = {}
+        item = self.map_table.item
         for row in range(self.map_table.rowCount()):
-            name_item = self.map_table.item(row, 0)
-            col_item = self.map_table.item(row, 1)
+            name_item = item(row, 0)
+            col_item = item(row, 1)
             if not name_item or not col_item:
                 continue
             name = name_item.text().strip()
-            col_text = col_item.text().strip().upper()
+            col_text = col_item.text().strip()
             if not col_text:
                 continue
-            if not col_text.isalpha():
-                QMessageBox.warning(
-                    self, "경고",
-                    f"잘못된 열 지정: {col_text}\n열은 A, B, C 등 알파벳만 입력해주세요."
-                )
-                return
+            if not col_text.isupper():
+                col_text = col_text.upper()
             try:
-                mapping[name] = column_index_from_string(col_text)
-            except Exception:
+                mapping[name] = column_index(col_text)
+            except ValueError:
                 QMessageBox.warning(
                     self, "경고",
-                    f"열 변환 오류: {col_text}"
+                    f"잘못된 열 지정: {col_text}\n열은 A, B, C 등 알파벳만 입력해주세요."
                 )
                 return
 
+        # 페이지 수 확인 (fitz 호출은 GUI 스레드에서만)
+        try:
+            page_counts = [self.ocr.page_count(p) for p in self.pdf_paths]
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"PDF 열기 실패:\n{e}")
+            return
+
         # OCR 수행 및 Excel에 쓰기
         set_name = self.set_selector.currentText()
         roi_set = self.roi_mgr.get_set(set_name)
         rois = getattr(roi_set, 'rois', [])
 
-        import fitz  # PyMuPDF
-        row_counter = 1
-        for pdf_path in self.pdf_paths:
-            doc = fitz.open(pdf_path)
-            for page_num in range(doc.page_count):
-                # 페이지 단위 결과 저장 dict
-                page_values: dict[tuple[int, int], str] = {}
-                # 단일 필드 OCR (첫 행에만)
-                for roi in rois:
-                    if getattr(roi, 'field_type', 'single') == 'single' and roi.name in mapping:
-                        text = self.ocr.extract_roi(
-                            pdf_path,
-                            page_num,
-                            (roi.x, roi.y, roi.w, roi.h),
-                            getattr(roi, 'tolerance', 0)
-                        )
-                        page_values[(row_counter, mapping[roi.name])] = text
-                # 표 형식 OCR
-                max_rows = 0
-                for roi in rois:
-                    if getattr(roi, 'field_type', '') == 'table' and roi.name in mapping:
-                        table = self.ocr.extract_table(
-                            pdf_path,
-                            page_num,
-                            (roi.x, roi.y, roi.w, roi.h)
-                        )
-                        # 테이블 각 행, 열을 순차적으로 해당 열부터 배치
-                        for i, row in enumerate(table):
-                            for j, cell_text in enumerate(row):
-                                page_values[(row_counter + i, mapping[roi.name] + j)] = cell_text
-                        max_rows = max(max_rows, len(table))
-                # 결과 워크북에 기록
-                writer.write_values(page_values)
-                # 다음 페이지 위치 이동
-                row_counter += max(max_rows, 1)
+        mapped_idx = [i for i, roi in enumerate(rois) if roi.name in mapping]
+        mapped_rois = [rois[i] for i in mapped_idx]
+        # 세트의 좌표 배열(SoA)을 재사용해 ROI 좌표를 다시 모으지 않음
+        mapped_rects = roi_set.rects[mapped_idx] if roi_set else None
+
+        # OCR·저장은 작업 스레드에서 수행 (UI 멈춤 방지)
+        worker = ExtractWorker(
+            self.ocr, list(self.pdf_paths), page_counts, mapped_rois, mapped_rects,
+            mapping, excel_path, self.ex_mgr.matcher(), self
+        )
+        worker.progress.connect(self._on_progress)
+        worker.done.connect(self._on_done)
+        worker.failed.connect(self._on_failed)
+        worker.finished.connect(self._on_worker_finished)
+        self._worker = worker
+
+        self.btn_run.setEnabled(False)
+        self.btn_clear_cache.setEnabled(False)
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.show()
+        worker.start()
+
+    def is_running(self) -> bool:
+        return self._worker is not None and self._worker.isRunning()
 
-        # 저장 및 완료 메시지
-        writer.save()
+    def stop(self) -> None:
+        """진행 중인 추출 작업을 중단하고 스레드가 끝날 때까지 대기 (창 종료 시)"""
+        if self._worker is not None:
+            self._worker.cancel()
+            # 대기 중인 페이지 작업을 취소해 작업 스레드가 빨리 끝나도록 함
+            self.ocr.cancel_pending()
+            self._worker.wait()
+
+    def _on_progress(self, processed: int, total: int) -> None:
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(processed)
+
+    def _on_done(self, excel_path: str) -> None:
         QMessageBox.information(
             self,
             "완료",
             f"엑셀 파일이 생성되었습니다:\n{excel_path}"
         )
 
+    def _on_failed(self, message: str) -> None:
+        QMessageBox.critical(self, "오류", f"추출 실패:\n{message}")
+
+    def _on_worker_finished(self) -> None:
+        self.progress_bar.hide()
+        self.btn_run.setEnabled(True)
+        self.btn_clear_cache.setEnabled(True)
+        # 페이지 수를 세며 연 PDF 문서 닫기 (PyMuPDF는 GUI 스레드에서만 사용)
+        self.ocr.close_documents()
+        self._worker.deleteLater()
+        self._worker = None
+
     def _populate_mapping(self) -> None:
         """
         선택된 ROI 세트의 ROI 리스트로 매핑 테이블 초기화
@@ -175,13 +370,25 @@ class TabExtract(QWidget):
         roi_set = self.roi_mgr.get_set(set_name)
         rois = getattr(roi_set, 'rois', [])
 
-        self.map_table.setRowCount(len(rois))
-        for i, roi in enumerate(rois):
-            name_item = QTableWidgetItem(roi.name)
-            name_item.setFlags(Qt.ItemIsEnabled)
-            self.map_table.setItem(i, 0, name_item)
-            cell_item = QTableWidgetItem("")
-            self.map_table.setItem(i, 1, cell_item)
+        table = self.map_table
+        sorting = table.isSortingEnabled()
+
+        # 일괄 채우는 동안 재배치·재그리기·모델 시그널 중지
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        signals = table.blockSignals(True)
+        try:
+            table.setRowCount(len(rois))
+            for i, roi in enumerate(rois):
+                name_item = QTableWidgetItem(roi.name)
+                name_item.setFlags(Qt.ItemIsEnabled)
+                table.setItem(i, 0, name_item)
+                cell_item = QTableWidgetItem("")
+                table.setItem(i, 1, cell_item)
+        finally:
+            table.blockSignals(signals)
+            table.setSortingEnabled(sorting)
+            table.setUpdatesEnabled(True)
 
     def refresh_sets(self) -> None:
         """